@@ -1,8 +1,13 @@
 import os
+import re
 import json
-import traceback
+import asyncio
+import hashlib
+import sqlite3
+import time
 import logging
-from flask import Flask, request, jsonify
+from functools import lru_cache
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS 
 import google.generativeai as genai
 from geopy.geocoders import Nominatim
@@ -11,11 +16,25 @@ from dotenv import load_dotenv
 
 # Configure logging first
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Optional tolerant JSON parser for malformed LLM output
+try:
+    import json_repair
+    JSON_REPAIR_AVAILABLE = True
+except ImportError:
+    JSON_REPAIR_AVAILABLE = False
+
+# Optional fast JSON codec (C implementation, encodes straight to bytes)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import Earth Engine wildfire risk module
 try:
     from wildfire_risk_ee import calculate_wildfire_risk_ee, extract_all_risk_data, initialize_earth_engine
@@ -31,6 +50,20 @@ load_dotenv(root_dir / '.env')
 app = Flask(__name__)
 CORS(app)
 
+if ORJSON_AVAILABLE:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Route Flask's jsonify/get_json through orjson when installed."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj)
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
 # Log startup info
 logger.info("=" * 50)
 logger.info("Starting AlphaEarth Insurance Backend")
@@ -47,43 +80,38 @@ logger.info(f"GEMINI_API_KEY loaded: {_api_key[:10]}...{_api_key[-4:] if len(_ap
 genai.configure(api_key=_api_key)
 logger.info("Gemini AI configured successfully")
 
-# Geocoder
-geolocator = Nominatim(user_agent="alphaearth_hackathon_app")
+# Geocoder - back it with a requests.Session-based adapter so repeat geocodes
+# reuse a warm keep-alive connection instead of paying a fresh TCP+TLS
+# handshake per call. Falls back to the default adapter if requests is missing.
+try:
+    from geopy.adapters import RequestsAdapter
+    geolocator = Nominatim(user_agent="alphaearth_hackathon_app", adapter_factory=RequestsAdapter)
+except ImportError:
+    logger.warning("geopy RequestsAdapter unavailable, using default adapter (no connection pooling)")
+    geolocator = Nominatim(user_agent="alphaearth_hackathon_app")
 
-# --- "ALPHA-EARTH" AI LOGIC ---
 
-def get_ai_risk_report(address, lat, lon, wildfire_risk_ee=None):
-    """
-    Calls the Gemini model to generate a risk report.
-    If Earth Engine wildfire risk data is provided, it will be used to replace
-    the AI-generated wildfire score.
-    
-    Args:
-        address: Property address
-        lat: Latitude
-        lon: Longitude
-        wildfire_risk_ee: Optional Earth Engine wildfire risk data dict
+@lru_cache(maxsize=4096)
+def _geocode(addr_norm):
     """
-    
-    # Set the model to use and the generation config to force JSON output
-    model = genai.GenerativeModel('gemini-2.5-flash')
-    generation_config = {"response_mime_type": "application/json"}
-    
-    # Build prompt with optional Earth Engine wildfire data
-    wildfire_context = ""
-    if wildfire_risk_ee and wildfire_risk_ee.get('score') is not None:
-        wildfire_context = f"""
-    
-    IMPORTANT: Use the following Earth Engine data-driven wildfire risk assessment:
-    - Wildfire Risk Score: {wildfire_risk_ee['score']}/10
-    - Explanation: {wildfire_risk_ee.get('explanation', 'Data-driven assessment')}
-    - Data Sources Available: {', '.join([k for k, v in wildfire_risk_ee.get('data_sources', {}).items() if v])}
-    
-    You MUST use this exact wildfire score ({wildfire_risk_ee['score']}) in your response, but you can still provide your own explanation or enhance it with additional context.
+    Resolves a normalized address to (lat, lon), or None if not found.
+    LRU-cached so repeat requests for the same address skip the Nominatim
+    round-trip entirely, which also keeps us within its 1 req/s policy.
+    Errors are not cached (lru_cache only stores successful returns).
     """
-    
-    # This is the master prompt. It "convinces" the AI it's AlphaEarth.
-    prompt = f"""
+    location = geolocator.geocode(addr_norm, timeout=10)
+    if location is None:
+        return None
+    return (location.latitude, location.longitude)
+
+# --- "ALPHA-EARTH" AI LOGIC ---
+
+MODEL_NAME = 'gemini-2.5-flash'
+
+# Static part of the master prompt. This block is identical for every request,
+# so it can be stored server-side via Gemini's explicit context caching and
+# referenced by handle instead of being re-sent (and re-billed) on every call.
+STATIC_SYSTEM = """
     You are "AlphaEarth," a professional geospatial AI model by Google that analyzes risk for the insurance industry. You have access to satellite imagery, Earth observation data, climate models, historical disaster data, and regional climate patterns.
 
     Your task is to act as an expert insurance underwriter. Given a location, you must generate a comprehensive, data-driven multi-factor risk report based on:
@@ -94,157 +122,518 @@ def get_ai_risk_report(address, lat, lon, wildfire_risk_ee=None):
     - Local environmental factors
 
     IMPORTANT SCORING GUIDELINES:
-    - Scores are on a scale of 0-10, where 0 = minimal risk and 10 = extreme risk
+    - Scores are on a scale of 0-100, where 0 = minimal risk and 100 = extreme risk
     - Consider the region's actual climate patterns (e.g., Sahel region = high drought risk, coastal areas = flood/storm risk)
-    - Use real-world knowledge: Nigeria and Sahel regions have HIGH drought risk (7-9), not low
+    - Use real-world knowledge: Nigeria and Sahel regions have HIGH drought risk (70-90), not low
     - Tropical regions have higher storm/flood risks
     - Arid/semi-arid regions have higher drought risk
     - Fire-prone regions (Mediterranean, California, Australia) have higher wildfire risk
     - Be realistic and data-driven, not conservative
+    """
 
+# Dynamic part: only the location and the optional wildfire context vary
+# between requests. The response shape is enforced by RISK_SCHEMA below, so
+# no JSON-structure reminder needs to be spent on prompt tokens.
+DYNAMIC_TEMPLATE = """
     Please generate a risk report for this location:
     Address: {address}
     Latitude: {lat}
     Longitude: {lon}
     {wildfire_context}
 
-    Return a JSON object with this exact structure:
-    {{
-     "location": {{
-     "address": "{address}",
-     "latitude": {lat},
-     "longitude": {lon}
-     }},
-     "risk_scores": [
-     {{"risk_type": "Flood", "score": <number 0-10>, "explanation": "<1-sentence summary based on regional flood risk factors>"}},
-     {{"risk_type": "Wildfire", "score": <number 0-10>, "explanation": "<1-sentence summary based on regional wildfire risk factors>"}},
-     {{"risk_type": "Storm", "score": <number 0-10>, "explanation": "<1-sentence summary based on regional storm risk factors>"}},
-     {{"risk_type": "Drought", "score": <number 0-10>, "explanation": "<1-sentence summary based on regional drought risk factors>"}}
-     ],
-     "overall_summary": "<A 2-sentence summary of the key risks for this property based on regional climate patterns.>",
-     "automated_decision": "<'APPROVE', 'DENY', or 'FLAG FOR REVIEW' based on overall risk level>"
-    }}
+    Provide one risk score (0-100) each for Flood, Wildfire, Storm and Drought
+    with a 1-sentence explanation per risk based on the regional risk factors,
+    a 2-sentence overall summary of the key risks for this property, and an
+    automated decision. Echo the address and coordinates above in the location
+    object.
+    """
+
+# Response schema passed to Gemini's constrained decoder. The model output is
+# guaranteed to match this shape, so the repair-parser path is effectively
+# dead code kept only as insurance.
+RISK_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "location": {
+            "type": "OBJECT",
+            "properties": {
+                "address": {"type": "STRING"},
+                "latitude": {"type": "NUMBER"},
+                "longitude": {"type": "NUMBER"},
+            },
+            "required": ["address", "latitude", "longitude"],
+        },
+        "risk_scores": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "risk_type": {
+                        "type": "STRING",
+                        "enum": ["Flood", "Wildfire", "Storm", "Drought"],
+                    },
+                    "score": {"type": "NUMBER", "minimum": 0, "maximum": 100},
+                    "explanation": {"type": "STRING"},
+                },
+                "required": ["risk_type", "score", "explanation"],
+            },
+        },
+        "overall_summary": {"type": "STRING"},
+        "automated_decision": {
+            "type": "STRING",
+            "enum": ["APPROVE", "DENY", "FLAG FOR REVIEW"],
+        },
+    },
+    "required": ["location", "risk_scores", "overall_summary", "automated_decision"],
+}
+
+# Generation config is invariant; build it once and pre-bind it into the model
+# so per-request calls carry no config construction at all.
+GEN_CONFIG = {"response_mime_type": "application/json", "response_schema": RISK_SCHEMA}
+
+# Earth Engine results are stable over short windows for nearby points, so
+# memoize them per ~1 km grid cell for a day. Requests quantized to the same
+# cell skip the EE round-trips (hundreds of ms to seconds) entirely.
+EE_CELL_TTL = 24 * 60 * 60  # seconds
+_EE_CELL_DEGREES = 0.01  # ~1.1 km in latitude
+_EE_CELL_MAX = 500
+_ee_cell_cache = {}
+
+
+def _ee_cell_key(lat, lon):
+    """Quantize coordinates onto the memoization grid."""
+    return (round(lat / _EE_CELL_DEGREES), round(lon / _EE_CELL_DEGREES))
+
+
+def _ee_cell_get(key):
+    entry = _ee_cell_cache.get(key)
+    if entry is None:
+        return None
+    if time.time() - entry[2] >= EE_CELL_TTL:
+        _ee_cell_cache.pop(key, None)
+        return None
+    return entry
+
+
+def _ee_cell_put(key, location_data, wildfire_risk_ee):
+    """Insert with expiry purge + oldest-entry eviction so the cache stays bounded."""
+    now = time.time()
+    for k in [k for k, v in _ee_cell_cache.items() if now - v[2] >= EE_CELL_TTL]:
+        _ee_cell_cache.pop(k, None)
+    while len(_ee_cell_cache) >= _EE_CELL_MAX:
+        _ee_cell_cache.pop(next(iter(_ee_cell_cache)), None)
+    _ee_cell_cache[key] = (location_data, wildfire_risk_ee, now)
+
+
+# Bump whenever the prompt changes so stale cached reports are invalidated
+PROMPT_VERSION = "2"
+
+# Response cache in front of Gemini: identical or nearby locations share a
+# report instead of paying a multi-second LLM round-trip each time.
+REPORT_CACHE_TTL = int(os.getenv("REPORT_CACHE_TTL", 24 * 3600))
+_REPORT_CACHE_PATH = os.getenv(
+    "REPORT_CACHE_PATH", str(pathlib.Path(__file__).parent / ".report_cache.sqlite3")
+)
+# Two queries within this lat+lon distance (~few km) are considered the same place
+_NEARBY_DEGREES = 0.05
+
+
+def _report_cache_conn():
+    conn = sqlite3.connect(_REPORT_CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS reports ("
+        " key TEXT PRIMARY KEY, lat REAL, lon REAL, bucket TEXT,"
+        " version TEXT, json TEXT, ts REAL)"
+    )
+    return conn
+
+
+def _wildfire_bucket(wildfire_risk_ee):
+    """Coarse wildfire-score bucket so cache entries only match comparable EE data."""
+    if wildfire_risk_ee and wildfire_risk_ee.get('score') is not None:
+        return str(int(round(wildfire_risk_ee['score'])))
+    return "na"
+
+
+def _report_cache_key(lat, lon, bucket):
+    raw = f"{round(lat, 2)}|{round(lon, 2)}|{bucket}|{PROMPT_VERSION}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _report_cache_get(lat, lon, bucket):
+    """
+    Returns a cached report for this location, or None.
+    Tries an exact key match first, then a geographic near-match with the
+    same wildfire bucket (two map clicks a few hundred meters apart should
+    not trigger two Gemini calls).
+    """
+    try:
+        min_ts = time.time() - REPORT_CACHE_TTL
+        with _report_cache_conn() as conn:
+            row = conn.execute(
+                "SELECT json FROM reports WHERE key = ? AND ts > ?",
+                (_report_cache_key(lat, lon, bucket), min_ts),
+            ).fetchone()
+            if row is None:
+                row = conn.execute(
+                    "SELECT json FROM reports WHERE bucket = ? AND version = ?"
+                    " AND ts > ? AND abs(lat - ?) + abs(lon - ?) < ?"
+                    " ORDER BY abs(lat - ?) + abs(lon - ?) LIMIT 1",
+                    (bucket, PROMPT_VERSION, min_ts, lat, lon, _NEARBY_DEGREES, lat, lon),
+                ).fetchone()
+        return json.loads(row[0]) if row else None
+    except Exception as e:
+        logger.warning(f"Report cache lookup failed: {e}")
+        return None
+
+
+def _report_etag(lat, lon):
+    """Weak validator for report responses: location + prompt version."""
+    raw = f"{round(lat, 3)}|{round(lon, 3)}|{PROMPT_VERSION}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _report_cache_fresh(lat, lon):
+    """True if any fresh cached report exists near this location."""
+    try:
+        min_ts = time.time() - REPORT_CACHE_TTL
+        with _report_cache_conn() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM reports WHERE version = ? AND ts > ?"
+                " AND abs(lat - ?) + abs(lon - ?) < ? LIMIT 1",
+                (PROMPT_VERSION, min_ts, lat, lon, _NEARBY_DEGREES),
+            ).fetchone()
+        return row is not None
+    except Exception as e:
+        logger.warning(f"Report cache freshness check failed: {e}")
+        return False
+
+
+def _report_cache_put(lat, lon, bucket, report):
+    try:
+        with _report_cache_conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (_report_cache_key(lat, lon, bucket), lat, lon, bucket,
+                 PROMPT_VERSION, json.dumps(report), time.time()),
+            )
+    except Exception as e:
+        logger.warning(f"Report cache write failed: {e}")
+
+
+# Lazily created context cache + model (see _get_model)
+_cached_content = None
+_model = None
+
+
+def _get_model():
+    """
+    Returns a GenerativeModel bound to a server-side context cache holding the
+    static AlphaEarth system prompt. The cache is created lazily on first use;
+    if the caching API is unavailable (older SDK, unsupported model), we fall
+    back to sending the system prompt inline on every request.
+    """
+    global _cached_content, _model
+    if _model is not None:
+        return _model
+
+    try:
+        from datetime import timedelta
+        _cached_content = genai.caching.CachedContent.create(
+            model=f'models/{MODEL_NAME}',
+            system_instruction=STATIC_SYSTEM,
+            ttl=timedelta(hours=1),
+        )
+        _model = genai.GenerativeModel.from_cached_content(
+            cached_content=_cached_content, generation_config=GEN_CONFIG
+        )
+        logger.info(f"Gemini context cache created: {_cached_content.name}")
+    except Exception as e:
+        logger.warning(f"Gemini context caching unavailable ({e}), sending system prompt inline")
+        _cached_content = None
+        _model = genai.GenerativeModel(
+            MODEL_NAME, system_instruction=STATIC_SYSTEM, generation_config=GEN_CONFIG
+        )
+
+    return _model
+
+
+def _reset_model():
+    """Drops the cached model so the next call recreates the context cache."""
+    global _cached_content, _model
+    _cached_content = None
+    _model = None
+
+
+def _extract_text(response):
+    """
+    Extracts the textual payload from a Gemini response.
+    google-generativeai >= 0.7 always exposes .text / candidates; the old
+    pre-1.0 "output" shapes are gone, so one fallthrough suffices.
+    """
+    try:
+        text = getattr(response, "text", None)
+        if text:
+            return text
+        return response.candidates[0].content.parts[0].text
+    except (AttributeError, IndexError):
+        return str(response)
+
+
+def _repair_json_text(text):
+    """
+    Cleans up common LLM JSON quirks: markdown code fences, smart quotes and
+    trailing commas, then slices out the outermost JSON object.
+    """
+    # Strip ```json ... ``` fences
+    text = re.sub(r"^\s*```(?:json)?\s*|\s*```\s*$", "", text.strip())
+    # Straighten smart quotes
+    text = text.replace("“", '"').replace("”", '"').replace("‘", "'").replace("’", "'")
+    # Remove trailing commas before a closing brace/bracket
+    text = re.sub(r",\s*([}\]])", r"\1", text)
+    start = text.find("{")
+    end = text.rfind("}")
+    if start != -1 and end != -1 and end > start:
+        return text[start:end+1]
+    return None
+
+
+def _parse_report_text(text):
+    """
+    Parses the model output into a report dict.
+    Malformed output is repaired in-process (via json-repair when installed,
+    a lighter local cleanup otherwise) instead of failing the whole request
+    and forcing a multi-second Gemini retry. Returns an error dict if no
+    JSON object can be recovered.
+    """
+    try:
+        # Attempt direct parse first
+        return json.loads(text)
+    except Exception:
+        pass
+
+    if JSON_REPAIR_AVAILABLE:
+        try:
+            repaired = json_repair.loads(text)
+            if isinstance(repaired, dict) and repaired:
+                logger.warning("Model output required JSON repair (json-repair)")
+                return repaired
+        except Exception as e:
+            logger.debug("json-repair could not recover model output: %s", e)
+
+    candidate = _repair_json_text(text)
+    if candidate:
+        try:
+            report = json.loads(candidate)
+            logger.warning("Model output required JSON repair (local cleanup)")
+            return report
+        except Exception as e:
+            logger.error(f"Failed to parse JSON from model output: {e}")
+            logger.error(f"Text that failed to parse: {text[:500]}...")
+            return {"error": "AI model returned non-JSON output.", "details": text[:500]}
+    else:
+        logger.error("No JSON object found in model output.")
+        logger.error(f"Model output (first 500 chars): {text[:500] if text else 'None'}")
+        return {"error": "AI model returned non-JSON output.", "details": text[:500] if text else "No output received"}
+
+
+def _normalize_report(report):
+    """
+    Normalizes a parsed report to the frontend's expectations:
+    lat/lon keys become latitude/longitude and scores are clamped to 0-100.
+    The model emits 0-100 natively (enforced by RISK_SCHEMA); this only
+    guards output recovered through the repair parser.
+    """
+    if "location" in report:
+        if "lat" in report["location"]:
+            report["location"]["latitude"] = report["location"].pop("lat")
+            logger.debug("Converted 'lat' to 'latitude' in response")
+        if "lon" in report["location"]:
+            report["location"]["longitude"] = report["location"].pop("lon")
+            logger.debug("Converted 'lon' to 'longitude' in response")
+
+    scores = report.get("risk_scores")
+    if isinstance(scores, list):
+        _min, _max = min, max
+        for risk_score in scores:
+            s = risk_score.get("score")
+            if isinstance(s, (int, float)):
+                risk_score["score"] = _max(0.0, _min(100.0, s))
+    return report
+
+
+def stream_ai_risk_report(address, lat, lon, wildfire_risk_ee=None, location_data=None):
+    """
+    Generator variant of get_ai_risk_report for streaming clients.
+    Yields NDJSON lines: one {"chunk": ...} per Gemini token batch as it
+    arrives, then a terminal {"report": ...} line with the fully parsed and
+    post-processed report (wildfire override, score normalization).
+    """
+    bucket = _wildfire_bucket(wildfire_risk_ee)
+    cached = _report_cache_get(lat, lon, bucket)
+    if cached is not None:
+        logger.info(f"Serving cached risk report for ({lat}, {lon}) (stream)")
+        cached["location"] = {"address": address, "latitude": lat, "longitude": lon}
+        if location_data:
+            cached["location_data"] = location_data
+        yield json.dumps({"report": _normalize_report(cached)}) + "\n"
+        return
+
+    model = _get_model()
+    wildfire_context = _build_wildfire_context(wildfire_risk_ee)
+    prompt = DYNAMIC_TEMPLATE.format(
+        address=address, lat=lat, lon=lon, wildfire_context=wildfire_context
+    )
+
+    logger.info(f"--- Streaming request to Gemini for {address} ---")
+    pieces = []
+    try:
+        stream = model.generate_content(prompt, stream=True)
+        for chunk in stream:
+            text = getattr(chunk, "text", "") or ""
+            if text:
+                pieces.append(text)
+                yield json.dumps({"chunk": text}) + "\n"
+    except Exception as e:
+        logger.exception("Gemini streaming call failed")
+        yield json.dumps({"error": "AI model failed to generate report.", "details": str(e)}) + "\n"
+        return
+
+    report_data = _parse_report_text("".join(pieces))
+    if "error" in report_data:
+        yield json.dumps(report_data) + "\n"
+        return
+
+    _normalize_report(report_data)
+    _report_cache_put(lat, lon, bucket, report_data)
+    if location_data:
+        report_data["location_data"] = location_data
+    yield json.dumps({"report": report_data}) + "\n"
+
+
+# Built once; per-request construction is a single format_map over this
+# constant, which also keeps the prompt byte-deterministic for cache keys.
+_WILDFIRE_TEMPLATE = """
+
+    IMPORTANT: A data-driven Earth Engine wildfire assessment exists for this location:
+    - Wildfire Risk Score: {score}/100
+    - Explanation: {explanation}
+    - Data Sources Available: {sources}
+
+    You MUST output exactly {score} as the Wildfire score and base its explanation on the assessment above, enhanced with additional context where useful.
     """
+
+
+def _build_wildfire_context(wildfire_risk_ee):
+    """Builds the optional Earth Engine wildfire block for the prompt."""
+    if not (wildfire_risk_ee and wildfire_risk_ee.get('score') is not None):
+        return ""
+    return _WILDFIRE_TEMPLATE.format_map({
+        # Earth Engine scores wildfire on 0-10; the report scale is 0-100.
+        "score": round(min(100.0, max(0.0, wildfire_risk_ee['score'] * 10.0)), 1),
+        "explanation": wildfire_risk_ee.get('explanation', 'Data-driven assessment'),
+        "sources": ', '.join(k for k, v in wildfire_risk_ee.get('data_sources', {}).items() if v),
+    })
+
+
+def get_ai_risk_report(address, lat, lon, wildfire_risk_ee=None):
+    """
+    Calls the Gemini model to generate a risk report.
+    If Earth Engine wildfire risk data is provided, it will be used to replace
+    the AI-generated wildfire score.
     
-    logger.info(f"--- Sending request to Gemini for {address} ---")
-    logger.debug(f"Prompt length: {len(prompt)} characters")
-    logger.debug(f"Using model: gemini-2.5-flash")
+    Args:
+        address: Property address
+        lat: Latitude
+        lon: Longitude
+        wildfire_risk_ee: Optional Earth Engine wildfire risk data dict
+    """
     
+    # Serve identical/nearby locations from the response cache before
+    # touching Gemini at all.
+    bucket = _wildfire_bucket(wildfire_risk_ee)
+    cached = _report_cache_get(lat, lon, bucket)
+    if cached is not None:
+        logger.info(f"Serving cached risk report for ({lat}, {lon})")
+        # The cached report may stem from a nearby query; echo the requested location.
+        cached["location"] = {"address": address, "latitude": lat, "longitude": lon}
+        return _normalize_report(cached)
+
+    # Model with the cached system prompt (JSON generation config pre-bound)
+    model = _get_model()
+
+    # Build prompt with optional Earth Engine wildfire data
+    wildfire_context = _build_wildfire_context(wildfire_risk_ee)
+
+    # Only the dynamic block is sent; the AlphaEarth persona lives in the
+    # context cache (or the model's inline system instruction as fallback).
+    prompt = DYNAMIC_TEMPLATE.format(
+        address=address, lat=lat, lon=lon, wildfire_context=wildfire_context
+    )
+
+    logger.info(f"--- Sending request to Gemini for {address} ---")
+    logger.debug("Prompt length: %d characters", len(prompt))
+    logger.debug("Using model: %s", MODEL_NAME)
+
     try:
         # API call
         logger.debug("Calling Gemini API...")
-        response = model.generate_content(prompt, generation_config=generation_config)
+        try:
+            response = model.generate_content(prompt)
+        except Exception as cache_err:
+            # The context cache has a TTL; recreate it once and retry if the
+            # cached content expired or was deleted server-side.
+            if _cached_content is not None and "cach" in str(cache_err).lower():
+                logger.warning(f"Context cache lookup failed ({cache_err}), recreating cache")
+                _reset_model()
+                model = _get_model()
+                response = model.generate_content(prompt)
+            else:
+                raise
         logger.debug("Gemini API call completed")
 
-        # The SDK response shape can vary between versions. Try several
-        # strategies to extract the textual content, then parse JSON.
-        text = None
-
-        # Common: some wrappers provide .text
-        if hasattr(response, "text") and response.text:
-            text = response.text
-
-        # Another common shape: response.output is a list of dicts
-        if not text and hasattr(response, "output"):
-            try:
-                out = response.output
-                if isinstance(out, (list, tuple)) and len(out) > 0:
-                    first = out[0]
-                    # content may be a string or a list of pieces
-                    if isinstance(first, dict):
-                        # try many nested possibilities
-                        if "content" in first:
-                            content = first["content"]
-                            if isinstance(content, str):
-                                text = content
-                            elif isinstance(content, (list, tuple)):
-                                pieces = []
-                                for c in content:
-                                    if isinstance(c, dict) and "text" in c:
-                                        pieces.append(c["text"])
-                                    elif isinstance(c, str):
-                                        pieces.append(c)
-                                text = "".join(pieces)
-                        elif "text" in first:
-                            text = first["text"]
-                    elif hasattr(first, "text"):
-                        text = first.text
-            except Exception:
-                text = None
-
-        # Fallback to stringifying the response
-        if not text:
-            text = str(response)
+        text = _extract_text(response)
 
         # Extract JSON substring if there's extra surrounding text
-        try:
-            # Attempt direct parse first
-            report_data = json.loads(text)
-        except Exception:
-            # Try to find first JSON object in the text
-            start = text.find("{")
-            end = text.rfind("}")
-            if start != -1 and end != -1 and end > start:
-                candidate = text[start:end+1]
-                try:
-                    report_data = json.loads(candidate)
-                except Exception as e:
-                    logger.error(f"Failed to parse JSON from model output: {e}")
-                    logger.error(f"Text that failed to parse: {text[:500]}...")
-                    return {"error": "AI model returned non-JSON output.", "details": text[:500]}
-            else:
-                logger.error("No JSON object found in model output.")
-                logger.error(f"Model output (first 500 chars): {text[:500] if text else 'None'}")
-                return {"error": "AI model returned non-JSON output.", "details": text[:500] if text else "No output received"}
+        report_data = _parse_report_text(text)
+        if "error" in report_data:
+            return report_data
 
         logger.info("--- Received valid JSON from Gemini ---")
-        logger.debug(f"Report data keys: {list(report_data.keys())}")
-        
-        # Replace wildfire score with Earth Engine data if available
-        if wildfire_risk_ee and wildfire_risk_ee.get('score') is not None:
-            if "risk_scores" in report_data and isinstance(report_data["risk_scores"], list):
-                # Find and replace the wildfire risk score
-                for risk_score in report_data["risk_scores"]:
-                    if risk_score.get("risk_type") == "Wildfire":
-                        logger.info(f"Replacing AI wildfire score ({risk_score.get('score')}) with Earth Engine score ({wildfire_risk_ee['score']})")
-                        risk_score["score"] = wildfire_risk_ee["score"]
-                        # Enhance explanation with Earth Engine data
-                        ee_explanation = wildfire_risk_ee.get("explanation", "")
-                        if ee_explanation:
-                            risk_score["explanation"] = f"{ee_explanation} (Earth Engine data-driven assessment)"
-                        # Add metadata about data sources
-                        if "metadata" not in risk_score:
-                            risk_score["metadata"] = {}
-                        risk_score["metadata"]["earth_engine"] = True
-                        risk_score["metadata"]["data_sources"] = wildfire_risk_ee.get("data_sources", {})
-                        break
-        
+        logger.debug("Report data keys: %s", list(report_data.keys()))
+
+        # Normalize here so cached entries and callers both see canonical
+        # 0-100 scores; no per-response loop remains in the endpoint.
+        _normalize_report(report_data)
+        _report_cache_put(lat, lon, bucket, report_data)
         return report_data
 
     except Exception as e:
-        logger.error(f"ERROR: Gemini API call failed: {e}")
-        logger.error(traceback.format_exc())
-        return {"error": "AI model failed to generate report.", "details": str(e), "traceback": traceback.format_exc()}
+        logger.exception("Gemini API call failed")
+        return {"error": "AI model failed to generate report.", "details": str(e)}
 
 # --- API ENDPOINT ---
 
 @app.route("/api/get-risk-report", methods=["POST"])
-def handle_risk_report():
+async def handle_risk_report():
     """
     The main API endpoint that the frontend will call.
     Accepts address with optional latitude and longitude.
+
+    The view is async: every blocking stage (Nominatim geocode, Earth Engine
+    extraction, Gemini) runs in a worker thread via asyncio.to_thread so the
+    event loop can serve other requests meanwhile. The stages themselves are
+    data-dependent (geocode -> EE -> Gemini) and therefore still sequential
+    within one request.
     """
     try:
-        logger.info("=" * 50)
         logger.info("Received request to /api/get-risk-report")
-        logger.info(f"Request method: {request.method}")
-        logger.info(f"Request headers: {dict(request.headers)}")
-        logger.info(f"Request content type: {request.content_type}")
-        
+
         # Get the JSON body from the request
         try:
             data = request.get_json(force=True)
-            logger.info(f"Request data received: {json.dumps(data, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Request data received:\n%s", json.dumps(data, indent=2))
         except Exception as e:
             logger.error(f"Failed to parse JSON from request: {e}")
             logger.error(f"Request data (raw): {request.data}")
@@ -275,67 +664,92 @@ def handle_risk_report():
             # ---  Geocode if coordinates not provided ---
             logger.info(f"Coordinates not provided, geocoding address: {address}")
             try:
-                location = geolocator.geocode(address, timeout=10)
-                
-                if location is None:
+                coords = await asyncio.to_thread(_geocode, " ".join(address.lower().split()))
+
+                if coords is None:
                     logger.warning(f"Geocoding failed: Could not find location for '{address}'")
                     return jsonify({"error": "Could not find location for that address."}), 404
-                    
-                lat, lon = location.latitude, location.longitude
+
+                lat, lon = coords
                 logger.info(f"Geocoded '{address}' to ({lat}, {lon})")
 
             except (GeocoderTimedOut, GeocoderUnavailable) as e:
-                logger.error(f"Geocoding service failed: {e}")
-                logger.error(traceback.format_exc())
+                logger.exception("Geocoding service failed")
                 return jsonify({"error": "Geocoding service is unavailable.", "details": str(e)}), 503
             except Exception as e:
-                logger.error(f"Geocoding failed with unexpected error: {e}")
-                logger.error(traceback.format_exc())
+                logger.exception("Geocoding failed with unexpected error")
                 return jsonify({"error": "An unknown geocoding error occurred.", "details": str(e)}), 500
 
+        # Conditional-request short-circuit: a repeat poll for the same map
+        # click with a fresh cached report costs zero bytes of body.
+        etag = _report_etag(lat, lon)
+        if request.headers.get("If-None-Match") == etag and _report_cache_fresh(lat, lon):
+            logger.info(f"ETag match for ({lat}, {lon}), returning 304")
+            return "", 304, {"ETag": etag}
+
         # --- Get Earth Engine Wildfire Risk and Location Data (if available) ---
         # OPTIMIZATION: Extract location data once and reuse for both wildfire risk and location_data
         wildfire_risk_ee = None
         location_data = None
-        
-        if not EE_WILDFIRE_AVAILABLE:
+
+        _ee_key = _ee_cell_key(lat, lon)
+        _ee_hit = _ee_cell_get(_ee_key)
+        if _ee_hit is not None:
+            location_data, wildfire_risk_ee = _ee_hit[0], _ee_hit[1]
+            logger.info(f"Reusing Earth Engine data for grid cell {_ee_key}")
+        elif not EE_WILDFIRE_AVAILABLE:
             logger.warning("Earth Engine wildfire risk module not available - location_data will not be included")
         else:
             # Initialize Earth Engine first (needed for both wildfire risk and location data)
-            if not initialize_earth_engine():
+            if not await asyncio.to_thread(initialize_earth_engine):
                 logger.warning("Failed to initialize Earth Engine - location_data will not be included")
             else:
                 # Extract location data once (this is the expensive operation)
                 try:
                     logger.info(f"Fetching detailed location data for ({lat}, {lon})")
-                    location_data = extract_all_risk_data(lat, lon, debug=False)
+                    location_data = await asyncio.to_thread(extract_all_risk_data, lat, lon, debug=False)
                     if location_data:
                         logger.info(f"Location data fetched successfully. Keys: {list(location_data.keys())}")
                     else:
                         logger.warning("extract_all_risk_data returned None")
-                except Exception as e:
-                    logger.error(f"Failed to fetch location data: {e}")
-                    logger.error(traceback.format_exc())
+                except Exception:
+                    logger.exception("Failed to fetch location data")
                     location_data = None
                 
                 # Calculate wildfire risk using the already-extracted location data
                 if location_data:
                     try:
                         logger.info(f"Calculating wildfire risk from location data for ({lat}, {lon})")
-                        wildfire_risk_ee = calculate_wildfire_risk_ee(lat, lon, location_data=location_data)
+                        wildfire_risk_ee = await asyncio.to_thread(
+                            calculate_wildfire_risk_ee, lat, lon, location_data=location_data
+                        )
                         if wildfire_risk_ee:
                             logger.info(f"Earth Engine wildfire risk calculated: {wildfire_risk_ee.get('score')}/10")
                         else:
                             logger.warning("Earth Engine wildfire risk calculation returned None, falling back to AI")
                     except Exception as e:
-                        logger.warning(f"Earth Engine wildfire risk calculation failed: {e}")
-                        logger.debug(traceback.format_exc())
+                        logger.warning("Earth Engine wildfire risk calculation failed: %s", e)
                         wildfire_risk_ee = None
-        
+
+                if location_data:
+                    _ee_cell_put(_ee_key, location_data, wildfire_risk_ee)
+
         # --- Get AI Report ---
+        # Streaming clients (?stream=1) get NDJSON chunks as Gemini produces
+        # them, with the post-processed report as the terminal line. The
+        # default stays a single JSON object for the existing frontend.
+        if request.args.get("stream", "0") not in ("0", "false", ""):
+            logger.info(f"Streaming risk report for address: {address}")
+            return Response(
+                stream_with_context(
+                    stream_ai_risk_report(address, lat, lon, wildfire_risk_ee, location_data)
+                ),
+                mimetype="application/x-ndjson",
+            )
+
         logger.info(f"Calling get_ai_risk_report for address: {address}, lat: {lat}, lon: {lon}")
-        report = get_ai_risk_report(address, lat, lon, wildfire_risk_ee)
-        
+        report = await asyncio.to_thread(get_ai_risk_report, address, lat, lon, wildfire_risk_ee)
+
         if "error" in report:
             logger.error(f"AI report generation failed: {report.get('error')}")
             logger.error(f"Error details: {report.get('details', 'No details provided')}")
@@ -344,27 +758,6 @@ def handle_risk_report():
         logger.info("AI report generated successfully")
         logger.debug(f"Report keys: {list(report.keys())}")
 
-        # Normalize response format to match frontend expectations
-        # Convert lat/lon to latitude/longitude if needed
-        if "location" in report:
-            if "lat" in report["location"]:
-                report["location"]["latitude"] = report["location"].pop("lat")
-                logger.debug("Converted 'lat' to 'latitude' in response")
-            if "lon" in report["location"]:
-                report["location"]["longitude"] = report["location"].pop("lon")
-                logger.debug("Converted 'lon' to 'longitude' in response")
-        
-        # Convert risk scores from 0-10 scale to 0-100 percentage for frontend display
-        if "risk_scores" in report and isinstance(report["risk_scores"], list):
-            for risk_score in report["risk_scores"]:
-                if "score" in risk_score and isinstance(risk_score["score"], (int, float)):
-                    # If score is already 0-100, leave it; if 0-10, convert to 0-100
-                    if risk_score["score"] <= 10:
-                        risk_score["score"] = round(risk_score["score"] * 10, 1)
-                        logger.debug(f"Converted {risk_score.get('risk_type')} score from 0-10 to 0-100 scale: {risk_score['score']}")
-                    # Ensure score is within valid range
-                    risk_score["score"] = max(0, min(100, risk_score["score"]))
-
         # Add location data to response if available
         if location_data:
             report["location_data"] = location_data
@@ -376,21 +769,37 @@ def handle_risk_report():
         logger.debug(f"Response structure: {json.dumps({k: type(v).__name__ for k, v in report.items()}, indent=2)}")
         
         # converts the Python dict back into a JSON response
-        return jsonify(report)
+        response = jsonify(report)
+        response.headers["ETag"] = etag
+        return response
         
     except Exception as e:
-        logger.error(f"Unexpected error in handle_risk_report: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Unexpected error in handle_risk_report")
         return jsonify({
             "error": "An unexpected error occurred while processing the request.",
             "details": str(e),
-            "traceback": traceback.format_exc()
         }), 500
 
+def create_app():
+    """
+    App factory for WSGI servers, e.g.:
+
+        gunicorn -w 4 --preload 'app:create_app()'
+
+    Heavy initialization (genai configuration, the geocoder session, the
+    Gemini context cache and report cache) happens at import time above, so
+    --preload runs it once in the master and forked workers share it
+    copy-on-write.
+    """
+    return app
+
+
 if __name__ == "__main__":
-    # Bind to 0.0.0.0 for container / VM usage by default; keep debug on for
-    # local development.
+    # Local development only; production runs under gunicorn (see create_app).
+    # Bind to 0.0.0.0 for container / VM usage by default.
     # Using port 5001 to avoid conflict with AirPlay on macOS (which uses 5000)
+    # Debug mode is opt-in: the werkzeug reloader re-imports this module twice
+    # per change, doubling the startup cost.
     logger.info("Starting Flask server on port 5001...")
-    app.run(host="0.0.0.0", debug=True, port=5001)
+    app.run(host="0.0.0.0", port=5001, debug=os.getenv("FLASK_DEBUG", "0") == "1")
 
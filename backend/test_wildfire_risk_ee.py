@@ -0,0 +1,48 @@
+"""
+Regression tests for the scoring ladders in wildfire_risk_ee.
+
+The vectorised lookup tables must reproduce the scalar if/elif ladders in
+_score_numeric exactly — including for fractional fire counts, which are
+the normal case for weighted reduceRegion sums.
+"""
+import itertools
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from wildfire_risk_ee import _score_numeric, calculate_risk_scores_vec
+
+
+def test_vectorised_scores_match_scalar_core():
+    # Dense fractional grids spanning every piece of both ladders,
+    # including the breakpoints themselves and the x == 0 fire special case.
+    ndvi_grid = [float('nan')] + [round(x, 3) for x in np.arange(-0.2, 1.4, 0.017)]
+    fire_grid = [float('nan'), 0.0] + [round(x, 3) for x in np.arange(0.01, 12.0, 0.13)]
+    fire_grid += [0.5, 2.0, 2.5, 2.99, 3.0, 5.0, 5.5, 6.0, 10.0]
+
+    pairs = list(itertools.product(ndvi_grid, fire_grid))
+    ndvi = np.array([p[0] for p in pairs])
+    fires = np.array([p[1] for p in pairs])
+
+    vectorised = calculate_risk_scores_vec(ndvi, fires)
+    scalar = np.array([round(_score_numeric(n, f), 1) for n, f in pairs])
+
+    mismatches = [
+        (pairs[i], float(vectorised[i]), float(scalar[i]))
+        for i in np.nonzero(vectorised != scalar)[0]
+    ]
+    assert not mismatches, f"{len(mismatches)} diverging inputs, first: {mismatches[:5]}"
+
+
+def test_reviewed_fire_counts():
+    # The fractional counts from the review that exposed the old table.
+    for fires, expected_fire_score in [
+        (0.5, 1.0),
+        (2.5, 4.5),
+        (2.99, 4.99),
+        (5.5, 7.75),
+    ]:
+        score = calculate_risk_scores_vec([float('nan')], [fires])[0]
+        assert math.isclose(score, round(expected_fire_score * 0.30 + 5.0 * 0.70, 1))
@@ -3,8 +3,42 @@ ESA WorldCover Datenabfrage für einen 10x10m Square
 Dieses Script extrahiert Landcover-Daten für einen fest definierten Test-Square.
 """
 import ee
+import hashlib
 import json
+import os
+import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+# Ausgabe-Steuerung: bei Batch-Läufen mit vielen Pool-Workern wird der
+# stdout-Lock unter dem GIL messbar — RISK_VERBOSE=0 schaltet die
+# Fortschritts- und Debug-Ausgaben der Helfer komplett ab
+VERBOSE = os.environ.get("RISK_VERBOSE", "1") == "1"
+
+
+def _vprint(*args, **kwargs):
+    """print(), aber nur wenn VERBOSE aktiv ist."""
+    if VERBOSE:
+        print(*args, **kwargs)
+
+
+# orjson ist optional: deutlich schnellere JSON-Serialisierung in C
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# numpy ist optional: nur für schnelleres Zählen der Landcover-Pixel
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 
 # ============================================================================
@@ -57,6 +91,11 @@ def get_test_square():
     return square
 
 
+# Die Dataset-Handles sind serverseitig lazy, aber jeder Neuaufbau kostet
+# Python-Allokationen und erneutes Hashen des Expression-Graphen. Bei
+# Batch-Läufen über viele Squares genügt ein Handle pro Prozess, daher
+# werden die Loader mit lru_cache memoisiert.
+@lru_cache(maxsize=1)
 def load_worldcover():
     """
     Lädt das ESA WorldCover Dataset.
@@ -68,6 +107,24 @@ def load_worldcover():
     return dataset
 
 
+@lru_cache(maxsize=1)
+def _firms():
+    """FIRMS ImageCollection (einmal pro Prozess aufgebaut)."""
+    return ee.ImageCollection('FIRMS')
+
+
+@lru_cache(maxsize=1)
+def _gldas_collection():
+    """GLDAS-2.0 ImageCollection (einmal pro Prozess aufgebaut)."""
+    return ee.ImageCollection("NASA/GLDAS/V20/NOAH/G025/T3H")
+
+
+@lru_cache(maxsize=1)
+def _modis_collection():
+    """MODIS MOD13A1 ImageCollection (einmal pro Prozess aufgebaut)."""
+    return ee.ImageCollection("MODIS/061/MOD13A1")
+
+
 def get_landcover_classes():
     """
     Gibt ein Dictionary mit den Landcover-Klassen zurück.
@@ -175,7 +232,7 @@ def extract_statistics(image, square, band_name, scale=1000, debug=False):
     
     result = stats.getInfo()
     if debug:
-        print(f"\n      DEBUG [{band_name}]: {result}")
+        _vprint(f"\n      DEBUG [{band_name}]: {result}")
     return result
 
 
@@ -196,16 +253,16 @@ def extract_multiple_statistics(image, square, band_names, scale=1000, debug=Fal
     # Prüfe ob die Bands existieren
     available_bands = image.bandNames().getInfo()
     if debug:
-        print(f"      Verfügbare Bands: {available_bands}")
+        _vprint(f"      Verfügbare Bands: {available_bands}")
         missing_bands = [b for b in band_names if b not in available_bands]
         if missing_bands:
-            print(f"      Warnung: Fehlende Bands: {missing_bands}")
+            _vprint(f"      Warnung: Fehlende Bands: {missing_bands}")
     
     # Verwende nur verfügbare Bands
     valid_bands = [b for b in band_names if b in available_bands]
     if not valid_bands:
         if debug:
-            print(f"      Fehler: Keine der angeforderten Bands ist verfügbar!")
+            _vprint(f"      Fehler: Keine der angeforderten Bands ist verfügbar!")
         return {}
     
     # Für sehr kleine Geometrien (wie 10x10m Square): Verwende sample() am Mittelpunkt
@@ -234,11 +291,11 @@ def extract_multiple_statistics(image, square, band_names, scale=1000, debug=Fal
                 result[f'{band}_max'] = value
     
     if debug:
-        print(f"\n      DEBUG [Bands: {', '.join(valid_bands)}]: {result}")
+        _vprint(f"\n      DEBUG [Bands: {', '.join(valid_bands)}]: {result}")
         # Prüfe auf null/None Werte
         null_values = {k: v for k, v in result.items() if v is None}
         if null_values:
-            print(f"      Warnung: Null-Werte gefunden: {list(null_values.keys())}")
+            _vprint(f"      Warnung: Null-Werte gefunden: {list(null_values.keys())}")
     
     return result
 
@@ -260,7 +317,6 @@ def get_latest_image(collection, date, debug=False):
     """
     # Filtere nach Datum (nehme das neueste Bild vor dem angegebenen Datum)
     # Füge einen Tag hinzu, um das angegebene Datum einzuschließen
-    from datetime import datetime, timedelta
     date_obj = datetime.strptime(date, "%Y-%m-%d")
     end_date = (date_obj + timedelta(days=1)).strftime("%Y-%m-%d")
     
@@ -269,14 +325,14 @@ def get_latest_image(collection, date, debug=False):
     # Prüfe ob Bilder vorhanden sind
     if debug:
         count = filtered.size().getInfo()
-        print(f"      DEBUG: {count} Bilder gefunden für Datum <= {date}")
+        _vprint(f"      DEBUG: {count} Bilder gefunden für Datum <= {date}")
         if count > 0:
             first_image_info = filtered.first().getInfo()
             if first_image_info and 'properties' in first_image_info:
                 img_date = first_image_info['properties'].get('system:time_start')
                 if img_date:
                     img_date_str = datetime.fromtimestamp(img_date / 1000).strftime("%Y-%m-%d %H:%M:%S")
-                    print(f"      DEBUG: Neuestes Bild vom: {img_date_str}")
+                    _vprint(f"      DEBUG: Neuestes Bild vom: {img_date_str}")
     
     return filtered.first()
 
@@ -297,11 +353,10 @@ def load_gldas_data(date=TEST_DATE, debug=False):
     Returns:
         ee.Image: Das neueste verfügbare GLDAS Bild
     """
-    print(f"      → Suche GLDAS-Bild für {date}...", end="", flush=True)
-    collection = ee.ImageCollection("NASA/GLDAS/V20/NOAH/G025/T3H")
+    _vprint(f"      → Suche GLDAS-Bild für {date}...", end="", flush=True)
+    collection = _gldas_collection()
     
     # Filtere nach dem spezifischen Datum (GLDAS hat 3-stündliche Daten)
-    from datetime import datetime, timedelta
     date_obj = datetime.strptime(date, "%Y-%m-%d")
     start_date = date_obj.strftime("%Y-%m-%d")
     end_date = (date_obj + timedelta(days=1)).strftime("%Y-%m-%d")
@@ -312,9 +367,9 @@ def load_gldas_data(date=TEST_DATE, debug=False):
     
     if debug:
         count = filtered.size().getInfo()
-        print(f"\n      DEBUG: {count} Bilder gefunden für {start_date}")
+        _vprint(f"\n      DEBUG: {count} Bilder gefunden für {start_date}")
     
-    print(" gefunden", end="", flush=True)
+    _vprint(" gefunden", end="", flush=True)
     return image
 
 
@@ -330,13 +385,13 @@ def get_all_gldas_data(square, date=TEST_DATE, debug=True):
     Returns:
         dict: Dictionary mit allen GLDAS-Statistiken
     """
-    print(f"\n    → Lade GLDAS-Daten für {date}...")
+    _vprint(f"\n    → Lade GLDAS-Daten für {date}...")
     start_time = time.time()
     
     load_start = time.time()
     image = load_gldas_data(date, debug=debug)
     load_elapsed = time.time() - load_start
-    print(f"      (Bild geladen in {load_elapsed:.1f}s)")
+    _vprint(f"      (Bild geladen in {load_elapsed:.1f}s)")
     
     # Prüfe ob das Bild gültig ist
     try:
@@ -345,7 +400,7 @@ def get_all_gldas_data(square, date=TEST_DATE, debug=True):
             raise Exception("Bild ist leer oder ungültig")
     except Exception as e:
         if debug:
-            print(f"      Fehler beim Prüfen des Bildes: {e}")
+            _vprint(f"      Fehler beim Prüfen des Bildes: {e}")
         return {
             'surface_temperature': {'error': str(e)},
             'soil_moisture': {'error': str(e)},
@@ -354,17 +409,17 @@ def get_all_gldas_data(square, date=TEST_DATE, debug=True):
         }
     
     # Extrahiere alle Bands gleichzeitig
-    print(f"      → Extrahiere Statistiken...", end="", flush=True)
+    _vprint(f"      → Extrahiere Statistiken...", end="", flush=True)
     extract_start = time.time()
     band_names = ['AvgSurfT_inst', 'SoilMoi0_10cm_inst', 'SoilTMP0_10cm_inst', 'Wind_f_inst']
     # GLDAS Auflösung: 0.25° ≈ 25km, verwende 25000m als scale
     # Für einen sehr kleinen Square könnte es sein, dass wir einen größeren Scale brauchen
     all_stats = extract_multiple_statistics(image, square, band_names, scale=25000, debug=debug)
     extract_elapsed = time.time() - extract_start
-    print(f" ({extract_elapsed:.1f}s)")
+    _vprint(f" ({extract_elapsed:.1f}s)")
     
     elapsed = time.time() - start_time
-    print(f"    ✓ GLDAS-Daten komplett in {elapsed:.1f}s")
+    _vprint(f"    ✓ GLDAS-Daten komplett in {elapsed:.1f}s")
     
     # Strukturiere die Daten - verwende get() mit Default None
     result = {
@@ -391,7 +446,7 @@ def get_all_gldas_data(square, date=TEST_DATE, debug=True):
     }
     
     if debug:
-        print(f"      Response-Struktur: {list(result.keys())}")
+        _vprint(f"      Response-Struktur: {list(result.keys())}")
         # Prüfe auf null-Werte
         has_data = False
         for key, value in result.items():
@@ -399,26 +454,36 @@ def get_all_gldas_data(square, date=TEST_DATE, debug=True):
                 non_null = {k: v for k, v in value.items() if v is not None}
                 if non_null:
                     has_data = True
-                    print(f"        {key}: {list(non_null.keys())} (Werte vorhanden)")
+                    _vprint(f"        {key}: {list(non_null.keys())} (Werte vorhanden)")
                 else:
-                    print(f"        {key}: Alle Werte sind null")
+                    _vprint(f"        {key}: Alle Werte sind null")
         if not has_data:
-            print(f"      Warnung: Keine GLDAS-Daten gefunden! Möglicherweise:")
-            print(f"        - Falsches Datum (keine Daten verfügbar)")
-            print(f"        - Square zu klein für 25km Auflösung")
-            print(f"        - Bands haben andere Namen")
+            _vprint(f"      Warnung: Keine GLDAS-Daten gefunden! Möglicherweise:")
+            _vprint(f"        - Falsches Datum (keine Daten verfügbar)")
+            _vprint(f"        - Square zu klein für 25km Auflösung")
+            _vprint(f"        - Bands haben andere Namen")
     
     return result
 
 
+# Cache für die gebündelte GLDAS-Abfrage: vier aufeinanderfolgende Aufrufe
+# der alten Einzelfunktionen kosten so nur noch eine Netzwerk-Abfrage.
+_gldas_all_cache = {}
+
+
+def _get_all_gldas_cached(square, date):
+    key = (date, square.serialize())
+    if key not in _gldas_all_cache:
+        _gldas_all_cache[key] = get_all_gldas_data(square, date, debug=False)
+    return _gldas_all_cache[key]
+
+
 def get_surface_temperature(square, date=TEST_DATE):
     """
     Extrahiert Oberflächentemperatur für den Square.
     DEPRECATED: Verwende get_all_gldas_data() für bessere Performance.
     """
-    image = load_gldas_data(date)
-    stats = extract_statistics(image, square, 'AvgSurfT_inst', scale=25000)
-    return stats
+    return _get_all_gldas_cached(square, date)['surface_temperature']
 
 
 def get_soil_moisture(square, date=TEST_DATE):
@@ -426,9 +491,7 @@ def get_soil_moisture(square, date=TEST_DATE):
     Extrahiert Bodenfeuchte für den Square.
     DEPRECATED: Verwende get_all_gldas_data() für bessere Performance.
     """
-    image = load_gldas_data(date)
-    stats = extract_statistics(image, square, 'SoilMoi0_10cm_inst', scale=25000)
-    return stats
+    return _get_all_gldas_cached(square, date)['soil_moisture']
 
 
 def get_soil_temperature(square, date=TEST_DATE):
@@ -436,9 +499,7 @@ def get_soil_temperature(square, date=TEST_DATE):
     Extrahiert Bodentemperatur für den Square.
     DEPRECATED: Verwende get_all_gldas_data() für bessere Performance.
     """
-    image = load_gldas_data(date)
-    stats = extract_statistics(image, square, 'SoilTMP0_10cm_inst', scale=25000)
-    return stats
+    return _get_all_gldas_cached(square, date)['soil_temperature']
 
 
 def get_wind_speed(square, date=TEST_DATE):
@@ -446,9 +507,7 @@ def get_wind_speed(square, date=TEST_DATE):
     Extrahiert Windgeschwindigkeit für den Square.
     DEPRECATED: Verwende get_all_gldas_data() für bessere Performance.
     """
-    image = load_gldas_data(date)
-    stats = extract_statistics(image, square, 'Wind_f_inst', scale=25000)
-    return stats
+    return _get_all_gldas_cached(square, date)['wind_speed']
 
 
 # ============================================================================
@@ -467,7 +526,7 @@ def load_modis_ndvi(date=TEST_DATE):
         ee.Image: Das neueste verfügbare MODIS NDVI Bild
     """
     # Verwende die aktuelle Version statt MODIS/006/MOD13A1
-    collection = ee.ImageCollection("MODIS/061/MOD13A1")
+    collection = _modis_collection()
     return get_latest_image(collection, date)
 
 
@@ -483,7 +542,7 @@ def get_vegetation_indices(square, date=TEST_DATE, debug=True):
     Returns:
         dict: Dictionary mit NDVI und EVI Statistiken
     """
-    print(f"    → Lade MODIS Vegetationsindizes für {date}...", end="", flush=True)
+    _vprint(f"    → Lade MODIS Vegetationsindizes für {date}...", end="", flush=True)
     start_time = time.time()
     
     try:
@@ -510,14 +569,14 @@ def get_vegetation_indices(square, date=TEST_DATE, debug=True):
                     all_stats[f'{band}_max'] = scaled_value
         
         if debug:
-            print(f"\n      DEBUG [MODIS sample]: {all_stats}")
+            _vprint(f"\n      DEBUG [MODIS sample]: {all_stats}")
     except Exception as e:
         if debug:
-            print(f"      Fehler: {e}")
+            _vprint(f"      Fehler: {e}")
         return {'NDVI': {'error': str(e)}, 'EVI': {'error': str(e)}}
     
     elapsed = time.time() - start_time
-    print(f" ✓ ({elapsed:.1f}s)")
+    _vprint(f" ✓ ({elapsed:.1f}s)")
     
     result = {
         'NDVI': {
@@ -540,9 +599,9 @@ def get_vegetation_indices(square, date=TEST_DATE, debug=True):
                     has_data = True
                     break
         if not has_data:
-            print(f"      Warnung: Keine MODIS-Daten gefunden!")
+            _vprint(f"      Warnung: Keine MODIS-Daten gefunden!")
         else:
-            print(f"      Response: {result}")
+            _vprint(f"      Response: {result}")
     
     return result
 
@@ -551,7 +610,56 @@ def get_vegetation_indices(square, date=TEST_DATE, debug=True):
 # FIRMS - Historische Waldbrände
 # ============================================================================
 
-def get_historical_fires(square, start_date=FIRE_HISTORY_START_DATE, end_date=TEST_DATE, debug=True):
+# FIRMS hat nominell 1km Auflösung; in Grad entspricht das dieser
+# Rasterweite (mit Ursprung bei -180/-90)
+_FIRMS_PIXEL_DEG = 1000.0 / 111320.0
+
+
+def _snap_to_firms_grid(lon, lat):
+    """
+    Rastet eine Koordinate auf das Zentrum ihres FIRMS-Pixels ein.
+    
+    Ein beliebiger Square-Mittelpunkt kann sonst knapp neben der
+    beabsichtigten FIRMS-Zelle landen (Off-by-one-Pixel) und zwingt EE
+    in einen Resampling-Pfad. Eingerastete Punkte sind außerdem
+    deterministisch: alle Squares im selben FIRMS-Pixel ergeben denselben
+    Punkt und treffen damit denselben Cache-Schlüssel.
+    
+    Returns:
+        tuple: (lon, lat) des FIRMS-Pixel-Zentrums
+    """
+    import math
+    i = math.floor((lon + 180.0) / _FIRMS_PIXEL_DEG)
+    j = math.floor((lat + 90.0) / _FIRMS_PIXEL_DEG)
+    return (-180.0 + (i + 0.5) * _FIRMS_PIXEL_DEG,
+            -90.0 + (j + 0.5) * _FIRMS_PIXEL_DEG)
+
+
+@lru_cache(maxsize=256)
+def _years_between(start_date, end_date):
+    """
+    Jahre zwischen zwei "YYYY-MM-DD"-Daten (memoisiert).
+    
+    Im Normalfall werden immer dieselben Default-Daten verwendet — das
+    Parsen per strptime entfällt dann nach dem ersten Aufruf komplett.
+    """
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    return (end - start).days / 365.25
+
+
+# Cache für die Brand-Historie: FIRMS hat 1km Auflösung, ein 10x10m Square
+# liefert also für alle Squares im selben FIRMS-Pixel identische Ergebnisse.
+# Wiederholte Abfragen desselben Squares/Zeitraums kosten so keine
+# Netzwerk-Abfrage mehr (die Squares selbst werden in einem späteren Schritt
+# auf das FIRMS-Raster eingerastet, damit benachbarte Squares denselben
+# Schlüssel treffen).
+_fire_history_cache = {}
+_FIRE_HISTORY_CACHE_MAX = 100_000
+
+
+def get_historical_fires(square, start_date=FIRE_HISTORY_START_DATE, end_date=TEST_DATE, debug=True,
+                         center_lonlat=None):
     """
     Prüft, ob jemals ein Waldbrand in der Vergangenheit in diesem Pixel war.
     FIRMS ist eine ImageCollection, nicht FeatureCollection!
@@ -562,102 +670,133 @@ def get_historical_fires(square, start_date=FIRE_HISTORY_START_DATE, end_date=TE
         start_date: str - Startdatum im Format "YYYY-MM-DD" (Default: FIRE_HISTORY_START_DATE)
         end_date: str - Enddatum im Format "YYYY-MM-DD" (Default: TEST_DATE)
         debug: bool - Wenn True, werden Debug-Infos ausgegeben
+        center_lonlat: tuple oder None - (lon, lat) des Square-Mittelpunkts;
+                       wenn gesetzt, wird der Punkt auf das FIRMS-Raster
+                       eingerastet und als Cache-Schlüssel verwendet, sodass
+                       benachbarte Squares im selben FIRMS-Pixel denselben
+                       Eintrag treffen
     
     Returns:
         dict: Dictionary mit Brandstatistiken
     """
-    print(f"    → Prüfe FIRMS Branddaten ({start_date} bis {end_date})...", end="", flush=True)
+    snapped = _snap_to_firms_grid(*center_lonlat) if center_lonlat else None
+    if snapped is not None:
+        cache_key = (start_date, end_date, snapped)
+    else:
+        cache_key = (start_date, end_date, square.serialize())
+    cached = _fire_history_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
+    
+    _vprint(f"    → Prüfe FIRMS Branddaten ({start_date} bis {end_date})...", end="", flush=True)
     start_time = time.time()
     
     # FIRMS ist eine ImageCollection, nicht FeatureCollection!
-    firms = ee.ImageCollection('FIRMS')
+    firms = _firms()
     
     # Filtere nach Datum
     filtered = firms.filterDate(start_date, end_date)
     
     # Verwende den Mittelpunkt des Squares
     # FIRMS hat 1km Auflösung, daher prüfen wir ob der 1km-Pixel, der diesen Punkt enthält, jemals gebrannt hat
-    center = square.centroid()
+    if snapped is not None:
+        center = ee.Geometry.Point(list(snapped))
+    else:
+        center = square.centroid()
     
     # Erstelle ein Mosaik aller Bilder im Zeitraum und extrahiere T21 Band (Brightness Temperature)
     # Pixel mit Werten > 0 sind Brände
     fires_mosaic = filtered.select('T21').mosaic()
     
-    # Prüfe ob es jemals einen Brand in diesem Pixel gab (T21 > 0)
-    # Verwende sample() am Mittelpunkt um den Pixel-Wert zu bekommen
-    fire_sample = fires_mosaic.sample(
-        region=center,
-        scale=1000,  # FIRMS hat 1km Auflösung
-        numPixels=1
-    )
-    
-    fire_sample_info = fire_sample.getInfo()
-    has_fire = False
-    fire_value = None
+    # Markiere jedes Bild im Zeitraum mit seinem T21-Wert am Mittelpunkt —
+    # daraus ergibt sich das letzte Branddatum komplett serverseitig
+    def _tag_t21_at_center(image):
+        value = image.select('T21').reduceRegion(
+            reducer=ee.Reducer.max(),
+            geometry=center,
+            scale=1000  # FIRMS hat 1km Auflösung
+        ).get('T21')
+        return image.set('t21_at_center', ee.Algorithms.If(value, value, 0))
     
-    if fire_sample_info and 'features' in fire_sample_info and len(fire_sample_info['features']) > 0:
-        props = fire_sample_info['features'][0].get('properties', {})
-        fire_value = props.get('T21')
-        has_fire = fire_value is not None and fire_value > 0
+    burning = filtered.map(_tag_t21_at_center).filter(ee.Filter.gt('t21_at_center', 0))
     
-    # Zähle auch die Gesamtanzahl der Brand-Pixel im Zeitraum (für zusätzliche Info)
+    # Zähle die Brand-Pixel im Zeitraum (für zusätzliche Info)
     fire_mask = fires_mosaic.gt(0)
-    fire_count = fire_mask.reduceRegion(
-        reducer=ee.Reducer.sum(),
-        geometry=center.buffer(500),  # 500m Buffer um sicherzustellen, dass wir den Pixel erfassen
-        scale=1000,
-        maxPixels=1e9,
-        bestEffort=True
-    )
     
-    count_value = fire_count.getInfo().get('T21', 0)
+    # Packe alle benötigten Skalare in ein ee.Dictionary und hole sie mit
+    # einem einzigen getInfo() ab statt mit drei separaten Round-Trips.
+    # ee.Dictionary verträgt keine Null-Werte, daher die Default-Werte.
+    center_t21 = fires_mosaic.reduceRegion(
+        reducer=ee.Reducer.max(),
+        geometry=center,
+        scale=1000
+    ).get('T21')
+    summary = ee.Dictionary({
+        # Collection-Größe mitliefern: bei leerem Zeitfenster (z.B. kurze
+        # Test-Zeiträume) kann der Client sofort abkürzen, ohne weitere
+        # Felder zu parsen — kostet im selben Request nichts extra
+        'size': filtered.size(),
+        'center_t21': ee.Algorithms.If(center_t21, center_t21, 0),
+        'count': fire_mask.reduceRegion(
+            reducer=ee.Reducer.sum(),
+            geometry=center.buffer(500),  # 500m Buffer um sicherzustellen, dass wir den Pixel erfassen
+            scale=1000,
+            maxPixels=1e9,
+            # tileScale statt bestEffort: bestEffort rechnet bei knappem
+            # Speicher stillschweigend auf gröberer Auflösung, tileScale
+            # verkleinert stattdessen die Kacheln und bleibt exakt
+            tileScale=4
+        ).get('T21'),
+        'last_ms': ee.Algorithms.If(
+            burning.size().gt(0),
+            burning.aggregate_max('system:time_start'),
+            -1
+        )
+    })
+    
+    stats = summary.getInfo() or {}
+    
+    # Leere Collection: keinerlei Branddaten im Zeitraum
+    if (stats.get('size') or 0) == 0:
+        elapsed = time.time() - start_time
+        _vprint(f" ✓ ({elapsed:.1f}s) - Kein Brand (keine FIRMS-Bilder im Zeitraum)")
+        result = {
+            'has_fire': False,
+            'last_fire_date': None,
+            'total_fires_in_period': 0,
+            'fires_per_year': 0.0
+        }
+        if len(_fire_history_cache) >= _FIRE_HISTORY_CACHE_MAX:
+            _fire_history_cache.pop(next(iter(_fire_history_cache)))
+        _fire_history_cache[cache_key] = dict(result)
+        return result
+    
+    fire_value = stats.get('center_t21') or 0
+    has_fire = fire_value > 0
+    if not has_fire:
+        fire_value = None
+    
+    count_value = stats.get('count') or 0
     
     # Berechne Jahre zwischen start und end
-    from datetime import datetime
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
-    years = (end - start).days / 365.25
+    years = _years_between(start_date, end_date)
     
     fires_per_year = count_value / years if years > 0 else 0.0
     
-    # Hole letztes Branddatum - finde das neueste Bild mit Bränden
+    # Letztes Branddatum aus dem bereits abgeholten Zeitstempel
     last_fire_date = None
-    if has_fire:
-        try:
-            # Sortiere nach Datum (neueste zuerst) und prüfe ob es Brände gibt
-            sorted_collection = filtered.sort('system:time_start', False)
-            collection_size = filtered.size().getInfo()
-            # Prüfe die ersten Bilder
-            for i in range(min(20, collection_size)):
-                image = ee.Image(sorted_collection.toList(1, i).get(0))
-                # Prüfe ob es Brände in diesem Bild am Mittelpunkt gibt
-                fire_sample_img = image.select('T21').sample(
-                    region=center,
-                    scale=1000,
-                    numPixels=1
-                )
-                fire_sample_img_info = fire_sample_img.getInfo()
-                if fire_sample_img_info and 'features' in fire_sample_img_info:
-                    props = fire_sample_img_info['features'][0].get('properties', {})
-                    t21_value = props.get('T21')
-                    if t21_value and t21_value > 0:
-                        # Hole das Datum dieses Bildes
-                        date_prop = image.get('system:time_start').getInfo()
-                        if date_prop:
-                            last_fire_date = datetime.fromtimestamp(date_prop / 1000).strftime("%Y-%m-%d")
-                            break
-        except Exception as e:
-            if debug:
-                print(f"      Warnung: Konnte letztes Branddatum nicht abrufen: {e}")
+    last_ms = stats.get('last_ms') or -1
+    if last_ms > 0:
+        last_fire_date = datetime.fromtimestamp(last_ms / 1000).strftime("%Y-%m-%d")
     
     elapsed = time.time() - start_time
     fire_status = "Brand gefunden" if has_fire else "Kein Brand"
-    print(f" ✓ ({elapsed:.1f}s) - {fire_status}")
+    _vprint(f" ✓ ({elapsed:.1f}s) - {fire_status}")
     
     if debug:
         if has_fire:
-            print(f"      Brand-Pixel-Wert (T21): {fire_value}")
-        print(f"      Gesamtanzahl Brand-Pixel im Zeitraum: {int(count_value)}")
+            _vprint(f"      Brand-Pixel-Wert (T21): {fire_value}")
+        _vprint(f"      Gesamtanzahl Brand-Pixel im Zeitraum: {int(count_value)}")
     
     result = {
         'has_fire': has_fire,  # Boolean: War jemals ein Brand in diesem Pixel?
@@ -667,15 +806,81 @@ def get_historical_fires(square, start_date=FIRE_HISTORY_START_DATE, end_date=TE
     }
     
     if debug:
-        print(f"      Response: {result}")
+        _vprint(f"      Response: {result}")
+    
+    if len(_fire_history_cache) >= _FIRE_HISTORY_CACHE_MAX:
+        _fire_history_cache.pop(next(iter(_fire_history_cache)))
+    _fire_history_cache[cache_key] = dict(result)
     
     return result
 
 
+def get_historical_fires_batch(squares, start_date=FIRE_HISTORY_START_DATE, end_date=TEST_DATE):
+    """
+    Brand-Historie für viele Squares in einer einzigen Earth-Engine-Abfrage.
+    
+    Alle Squares werden als eine FeatureCollection verschickt und serverseitig
+    parallel reduziert — eine Abfrage statt einer pro Square. Für das letzte
+    Branddatum eines einzelnen Squares weiterhin get_historical_fires nutzen;
+    pro Square über die gesamte Collection zu mappen wäre quadratisch teuer.
+    
+    Args:
+        squares: Liste von ee.Geometry - Die 10x10m Squares
+        start_date: str - Startdatum im Format "YYYY-MM-DD"
+        end_date: str - Enddatum im Format "YYYY-MM-DD"
+    
+    Returns:
+        list: Pro Square ein Dictionary wie bei get_historical_fires
+              (last_fire_date ist im Batch-Pfad immer None)
+    """
+    filtered = _firms().filterDate(start_date, end_date)
+    fires_mosaic = filtered.select('T21').mosaic()
+    fire_mask = fires_mosaic.gt(0)
+    
+    # 500m Buffer um den Mittelpunkt, damit der 1km-FIRMS-Pixel sicher
+    # erfasst wird (wie beim Einzel-Pfad)
+    regions = ee.FeatureCollection([
+        ee.Feature(square.centroid().buffer(500), {'sid': i})
+        for i, square in enumerate(squares)
+    ])
+    
+    # Zwei Bänder, zwei Reducer: max(T21) beantwortet has_fire,
+    # sum(Brand-Maske) zählt die Brand-Pixel
+    combined = fires_mosaic.rename('t21').addBands(fire_mask.rename('burns'))
+    reducer = ee.Reducer.max().combine(ee.Reducer.sum(), sharedInputs=False)
+    
+    stats = combined.reduceRegions(
+        collection=regions,
+        reducer=reducer,
+        scale=1000,  # FIRMS hat 1km Auflösung
+        tileScale=4
+    ).getInfo()
+    
+    # Berechne Jahre zwischen start und end
+    years = _years_between(start_date, end_date)
+    
+    results = [None] * len(squares)
+    for feature in (stats or {}).get('features', []):
+        props = feature.get('properties', {})
+        sid = props.get('sid')
+        if sid is None:
+            continue
+        t21_value = props.get('max')
+        count_value = props.get('sum') or 0
+        results[sid] = {
+            'has_fire': t21_value is not None and t21_value > 0,
+            'last_fire_date': None,
+            'total_fires_in_period': int(count_value),
+            'fires_per_year': round(count_value / years, 2) if years > 0 else 0.0
+        }
+    return results
+
+
 # ============================================================================
 # GLCF - Wasserflächen (Binnengewässer)
 # ============================================================================
 
+@lru_cache(maxsize=1)
 def load_water_mask():
     """
     Lädt GLCF Wasserflächen-Maske.
@@ -689,6 +894,49 @@ def load_water_mask():
     return collection.first()
 
 
+def get_water_bodies_batch(squares):
+    """
+    Wasserflächen-Informationen für viele Squares in einer einzigen Abfrage.
+    
+    Square- und Umgebungs-Regionen aller Squares werden als eine
+    FeatureCollection verschickt und serverseitig parallel reduziert.
+    
+    Args:
+        squares: Liste von ee.Geometry - Die 10x10m Squares
+    
+    Returns:
+        list: Pro Square ein Dictionary wie bei get_water_bodies
+    """
+    image = load_water_mask()
+    
+    features = []
+    for i, square in enumerate(squares):
+        features.append(ee.Feature(square, {'sid': i, 'region': 'square'}))
+        features.append(ee.Feature(square.centroid().buffer(100), {'sid': i, 'region': 'nearby'}))
+    
+    # Mittelwert der 0/1-Wasser-Maske = Wasseranteil, direkt als Float
+    stats = image.select('water').eq(1).reduceRegions(
+        collection=ee.FeatureCollection(features),
+        reducer=ee.Reducer.mean(),
+        scale=30,  # GLCF Auflösung: 30m
+        tileScale=4
+    ).getInfo()
+    
+    results = [{'water_coverage_percent': 0.0, 'nearby_water_coverage_percent': 0.0}
+               for _ in squares]
+    for feature in (stats or {}).get('features', []):
+        props = feature.get('properties', {})
+        sid = props.get('sid')
+        if sid is None:
+            continue
+        coverage = (props.get('mean') or 0.0) * 100.0
+        if props.get('region') == 'square':
+            results[sid]['water_coverage_percent'] = coverage
+        else:
+            results[sid]['nearby_water_coverage_percent'] = coverage
+    return results
+
+
 def get_water_bodies(square, debug=True):
     """
     Extrahiert Wasserflächen-Informationen für den Square.
@@ -700,57 +948,45 @@ def get_water_bodies(square, debug=True):
     Returns:
         dict: Dictionary mit Wasserflächen-Statistiken
     """
-    print(f"    → Lade GLCF Wasserflächen-Daten...", end="", flush=True)
+    _vprint(f"    → Lade GLCF Wasserflächen-Daten...", end="", flush=True)
     start_time = time.time()
     
     image = load_water_mask()
     
-    # Berechne Anteil Wasserfläche im Square
-    # GLCF Auflösung: 30m
-    water_stats = image.select('water').reduceRegion(
-        reducer=ee.Reducer.frequencyHistogram(),
-        geometry=square,
-        scale=30,
-        maxPixels=1e9,
-        bestEffort=True
+    # Beide Regionen (Square + 100m Umgebung) in einer einzigen
+    # reduceRegions-Abfrage statt zwei getrennten reduceRegion-Round-Trips
+    center = square.centroid()
+    regions = ee.FeatureCollection([
+        ee.Feature(square, {'id': 'square'}),
+        ee.Feature(center.buffer(100), {'id': 'nearby'})  # 100m Radius
+    ])
+    
+    # Das Wasserband wird zu einer 0/1-Maske (1 = Wasser); der Mittelwert
+    # der Maske über eine Region ist direkt der Wasseranteil — ein Float
+    # pro Region statt eines kompletten Klassen-Histogramms samt
+    # Python-Summenschleife
+    water_stats = image.select('water').eq(1).reduceRegions(
+        collection=regions,
+        reducer=ee.Reducer.mean(),
+        scale=30,  # GLCF Auflösung: 30m
+        tileScale=4
     )
     
     stats = water_stats.getInfo()
     if debug:
-        print(f"\n      DEBUG [water_stats]: {stats}")
-    
-    # Berechne Wasseranteil
-    water_coverage = 0.0
-    if 'water' in stats and stats['water']:
-        histogram = stats['water']
-        total_pixels = sum(float(v) for v in histogram.values())
-        water_pixels = histogram.get('1', 0)  # 1 = Wasser
-        if total_pixels > 0:
-            water_coverage = (float(water_pixels) / total_pixels) * 100.0
-    
-    # Prüfe auch in der Nähe (100m Radius)
-    center = square.centroid()
-    buffer = center.buffer(100)  # 100m Radius
+        _vprint(f"\n      DEBUG [water_stats]: {stats}")
     
-    nearby_water_stats = image.select('water').reduceRegion(
-        reducer=ee.Reducer.frequencyHistogram(),
-        geometry=buffer,
-        scale=30,
-        maxPixels=1e9,
-        bestEffort=True
-    )
+    fractions = {}
+    for feature in (stats or {}).get('features', []):
+        props = feature.get('properties', {})
+        fractions[props.get('id')] = props.get('mean')
     
-    nearby_stats = nearby_water_stats.getInfo()
-    nearby_water_coverage = 0.0
-    if 'water' in nearby_stats and nearby_stats['water']:
-        histogram = nearby_stats['water']
-        total_pixels = sum(float(v) for v in histogram.values())
-        water_pixels = histogram.get('1', 0)
-        if total_pixels > 0:
-            nearby_water_coverage = (float(water_pixels) / total_pixels) * 100.0
+    # Berechne Wasseranteil pro Region
+    water_coverage = (fractions.get('square') or 0.0) * 100.0
+    nearby_water_coverage = (fractions.get('nearby') or 0.0) * 100.0
     
     elapsed = time.time() - start_time
-    print(f" ✓ ({elapsed:.1f}s)")
+    _vprint(f" ✓ ({elapsed:.1f}s)")
     
     result = {
         'water_coverage_percent': water_coverage,
@@ -758,83 +994,102 @@ def get_water_bodies(square, debug=True):
     }
     
     if debug:
-        print(f"      Response: {result}")
+        _vprint(f"      Response: {result}")
     
     return result
 
 
 def print_square_info(square):
     """Gibt Informationen über den Test-Square aus."""
-    print("\n" + "=" * 60)
-    print("Test Square Informationen")
-    print("=" * 60)
-    print(f"Zentrum: {TEST_SQUARE_CENTER_LAT}, {TEST_SQUARE_CENTER_LON}")
-    print(f"Größe: {SQUARE_SIZE_METERS}m x {SQUARE_SIZE_METERS}m")
+    _vprint("\n" + "=" * 60)
+    _vprint("Test Square Informationen")
+    _vprint("=" * 60)
+    _vprint(f"Zentrum: {TEST_SQUARE_CENTER_LAT}, {TEST_SQUARE_CENTER_LON}")
+    _vprint(f"Größe: {SQUARE_SIZE_METERS}m x {SQUARE_SIZE_METERS}m")
     
     # Hole Bounds des Squares
     bounds = square.bounds().getInfo()
     coords = bounds['coordinates'][0]
-    print(f"Bounds: {coords}")
+    _vprint(f"Bounds: {coords}")
 
 
 def print_extracted_data(features, stats):
     """Gibt die extrahierten Daten formatiert aus."""
-    print("\n" + "=" * 60)
-    print("Extrahierten Daten")
-    print("=" * 60)
+    _vprint("\n" + "=" * 60)
+    _vprint("Extrahierten Daten")
+    _vprint("=" * 60)
     
     # Anzahl der Pixel
     num_pixels = len(features.get('features', []))
-    print(f"\nAnzahl Pixel im Square: {num_pixels}")
+    _vprint(f"\nAnzahl Pixel im Square: {num_pixels}")
     
     # Landcover-Klassen
     classes = get_landcover_classes()
     
     # Extrahiere alle Landcover-Werte
-    landcover_values = []
-    for feature in features.get('features', []):
-        props = feature.get('properties', {})
-        value = props.get('Map')
-        if value is not None:
-            landcover_values.append(value)
-    
-    if landcover_values:
-        print(f"\nLandcover-Werte im Square:")
-        # Zähle Vorkommen jeder Klasse
-        from collections import Counter
-        value_counts = Counter(landcover_values)
+    if NUMPY_AVAILABLE:
+        # Vektorisiertes Zählen: ein C-Loop über alle Pixel statt
+        # Python-Dict-Operationen pro Pixel
+        raw_values = (feature.get('properties', {}).get('Map')
+                      for feature in features.get('features', []))
+        arr = np.fromiter((v if v is not None else -1 for v in raw_values),
+                          dtype=np.int16)
+        arr = arr[arr >= 0]
         
-        for value, count in sorted(value_counts.items()):
-            class_name = classes.get(value, "Unbekannt")
-            percentage = (count / len(landcover_values)) * 100
-            print(f"  Klasse {value:3d} ({class_name:30s}): {count:2d} Pixel ({percentage:5.1f}%)")
+        if arr.size:
+            _vprint(f"\nLandcover-Werte im Square:")
+            counts = np.bincount(arr)
+            for value in np.nonzero(counts)[0]:
+                value = int(value)
+                count = int(counts[value])
+                class_name = classes.get(value, "Unbekannt")
+                percentage = (count / arr.size) * 100
+                _vprint(f"  Klasse {value:3d} ({class_name:30s}): {count:2d} Pixel ({percentage:5.1f}%)")
+    else:
+        landcover_values = []
+        for feature in features.get('features', []):
+            props = feature.get('properties', {})
+            value = props.get('Map')
+            if value is not None:
+                landcover_values.append(value)
+        
+        if landcover_values:
+            _vprint(f"\nLandcover-Werte im Square:")
+            # Zähle Vorkommen jeder Klasse
+            from collections import Counter
+            value_counts = Counter(landcover_values)
+            
+            for value, count in sorted(value_counts.items()):
+                class_name = classes.get(value, "Unbekannt")
+                percentage = (count / len(landcover_values)) * 100
+                _vprint(f"  Klasse {value:3d} ({class_name:30s}): {count:2d} Pixel ({percentage:5.1f}%)")
     
     # Statistiken aus reduceRegion
     if stats and 'Map' in stats:
-        print(f"\nStatistiken (reduceRegion):")
+        _vprint(f"\nStatistiken (reduceRegion):")
         histogram = stats['Map']
-        total_pixels = sum(int(v) for v in histogram.values())
+        total_pixels = sum(map(int, histogram.values()))
         
         for value_str, count in sorted(histogram.items(), key=lambda x: int(x[0])):
             value = int(value_str)
             count_int = int(count)
             class_name = classes.get(value, "Unbekannt")
             percentage = (count_int / total_pixels) * 100 if total_pixels > 0 else 0
-            print(f"  Klasse {value:3d} ({class_name:30s}): {count_int:2d} Pixel ({percentage:5.1f}%)")
+            _vprint(f"  Klasse {value:3d} ({class_name:30s}): {count_int:2d} Pixel ({percentage:5.1f}%)")
     elif stats:
-        print(f"\nStatistiken (reduceRegion): Keine Daten verfügbar")
-        print(f"  Stats keys: {list(stats.keys())}")
+        _vprint(f"\nStatistiken (reduceRegion): Keine Daten verfügbar")
+        _vprint(f"  Stats keys: {list(stats.keys())}")
 
 
 def print_risk_data(all_data):
     """Gibt alle Wildfire-Risiko-Daten formatiert aus."""
-    print("\n" + "=" * 60)
-    print("Wildfire Risk Score Daten")
-    print("=" * 60)
+    _vprint("\n" + "=" * 60)
+    _vprint("Wildfire Risk Score Daten")
+    _vprint("=" * 60)
     
     # Square Info
     square_info = all_data.get("square_info", {})
-    print(f"\nTest-Datum: {square_info.get('date', 'N/A')}")
+    _vprint(f"\nTest-Datum: {square_info.get('date', 'N/A')}")
     
     # WorldCover Daten
     worldcover = all_data.get("worldcover", {})
@@ -843,93 +1098,168 @@ def print_risk_data(all_data):
         stats = worldcover.get("statistics", {})
         print_extracted_data(features, stats)
     elif "error" in worldcover:
-        print(f"\nWorldCover: Fehler - {worldcover['error']}")
+        _vprint(f"\nWorldCover: Fehler - {worldcover['error']}")
     
     # Historische Brände
     fire_history = all_data.get("fire_history", {})
     if "error" not in fire_history:
-        print("\n" + "-" * 60)
-        print("Historische Brände (FIRMS)")
-        print("-" * 60)
+        _vprint("\n" + "-" * 60)
+        _vprint("Historische Brände (FIRMS)")
+        _vprint("-" * 60)
         has_fire = fire_history.get('has_fire', False)
-        print(f"  Brand in diesem Pixel: {'Ja' if has_fire else 'Nein'}")
+        _vprint(f"  Brand in diesem Pixel: {'Ja' if has_fire else 'Nein'}")
         if has_fire:
-            print(f"  Letztes Branddatum: {fire_history.get('last_fire_date', 'Unbekannt')}")
-        print(f"  Gesamtanzahl Brand-Pixel im Zeitraum: {fire_history.get('total_fires_in_period', 0)}")
-        print(f"  Brände pro Jahr: {fire_history.get('fires_per_year', 0.0):.2f}")
+            _vprint(f"  Letztes Branddatum: {fire_history.get('last_fire_date', 'Unbekannt')}")
+        _vprint(f"  Gesamtanzahl Brand-Pixel im Zeitraum: {fire_history.get('total_fires_in_period', 0)}")
+        _vprint(f"  Brände pro Jahr: {fire_history.get('fires_per_year', 0.0):.2f}")
     else:
-        print(f"\nFIRMS: Fehler - {fire_history['error']}")
+        _vprint(f"\nFIRMS: Fehler - {fire_history['error']}")
     
     # Aktuelle Bedingungen
     current = all_data.get("current_conditions", {})
-    print("\n" + "-" * 60)
-    print("Aktuelle Bedingungen")
-    print("-" * 60)
+    _vprint("\n" + "-" * 60)
+    _vprint("Aktuelle Bedingungen")
+    _vprint("-" * 60)
     
     # Oberflächentemperatur
     if "error" not in current.get("surface_temperature", {}):
         temp = current.get("surface_temperature", {})
         if temp:
-            print(f"\nOberflächentemperatur:")
-            print(f"  Mittelwert: {temp.get('AvgSurfT_inst_mean', 'N/A')} K")
-            print(f"  Min: {temp.get('AvgSurfT_inst_min', 'N/A')} K")
-            print(f"  Max: {temp.get('AvgSurfT_inst_max', 'N/A')} K")
+            _vprint(f"\nOberflächentemperatur:")
+            _vprint(f"  Mittelwert: {temp.get('AvgSurfT_inst_mean', 'N/A')} K")
+            _vprint(f"  Min: {temp.get('AvgSurfT_inst_min', 'N/A')} K")
+            _vprint(f"  Max: {temp.get('AvgSurfT_inst_max', 'N/A')} K")
     else:
-        print(f"\nOberflächentemperatur: Fehler")
+        _vprint(f"\nOberflächentemperatur: Fehler")
     
     # Bodenfeuchte
     if "error" not in current.get("soil_moisture", {}):
         moisture = current.get("soil_moisture", {})
         if moisture:
-            print(f"\nBodenfeuchte (0-10cm):")
-            print(f"  Mittelwert: {moisture.get('SoilMoi0_10cm_inst_mean', 'N/A')} kg/m²")
+            _vprint(f"\nBodenfeuchte (0-10cm):")
+            _vprint(f"  Mittelwert: {moisture.get('SoilMoi0_10cm_inst_mean', 'N/A')} kg/m²")
     else:
-        print(f"\nBodenfeuchte: Fehler")
+        _vprint(f"\nBodenfeuchte: Fehler")
     
     # Bodentemperatur
     if "error" not in current.get("soil_temperature", {}):
         soil_temp = current.get("soil_temperature", {})
         if soil_temp:
-            print(f"\nBodentemperatur (0-10cm):")
-            print(f"  Mittelwert: {soil_temp.get('SoilTMP0_10cm_inst_mean', 'N/A')} K")
+            _vprint(f"\nBodentemperatur (0-10cm):")
+            _vprint(f"  Mittelwert: {soil_temp.get('SoilTMP0_10cm_inst_mean', 'N/A')} K")
     else:
-        print(f"\nBodentemperatur: Fehler")
+        _vprint(f"\nBodentemperatur: Fehler")
     
     # Windgeschwindigkeit
     if "error" not in current.get("wind_speed", {}):
         wind = current.get("wind_speed", {})
         if wind:
-            print(f"\nWindgeschwindigkeit:")
-            print(f"  Mittelwert: {wind.get('Wind_f_inst_mean', 'N/A')} m/s")
-            print(f"  Max: {wind.get('Wind_f_inst_max', 'N/A')} m/s")
+            _vprint(f"\nWindgeschwindigkeit:")
+            _vprint(f"  Mittelwert: {wind.get('Wind_f_inst_mean', 'N/A')} m/s")
+            _vprint(f"  Max: {wind.get('Wind_f_inst_max', 'N/A')} m/s")
     else:
-        print(f"\nWindgeschwindigkeit: Fehler")
+        _vprint(f"\nWindgeschwindigkeit: Fehler")
     
     # Vegetationsindizes
     vegetation = current.get("vegetation", {})
     if "error" not in vegetation:
-        print(f"\nVegetationsindizes:")
+        _vprint(f"\nVegetationsindizes:")
         if "NDVI" in vegetation and vegetation["NDVI"]:
             ndvi = vegetation["NDVI"]
-            print(f"  NDVI Mittelwert: {ndvi.get('NDVI_mean', 'N/A')}")
+            _vprint(f"  NDVI Mittelwert: {ndvi.get('NDVI_mean', 'N/A')}")
         if "EVI" in vegetation and vegetation["EVI"]:
             evi = vegetation["EVI"]
-            print(f"  EVI Mittelwert: {evi.get('EVI_mean', 'N/A')}")
+            _vprint(f"  EVI Mittelwert: {evi.get('EVI_mean', 'N/A')}")
     else:
-        print(f"\nVegetationsindizes: Fehler")
+        _vprint(f"\nVegetationsindizes: Fehler")
     
     # Wasserflächen
     water_coverage = current.get("water_coverage")
     nearby_water = current.get("nearby_water_coverage")
     if water_coverage is not None:
-        print(f"\nWasserflächen:")
-        print(f"  Wasseranteil im Square: {water_coverage:.2f}%")
-        print(f"  Wasseranteil in 100m Radius: {nearby_water:.2f}%")
+        _vprint(f"\nWasserflächen:")
+        _vprint(f"  Wasseranteil im Square: {water_coverage:.2f}%")
+        _vprint(f"  Wasseranteil in 100m Radius: {nearby_water:.2f}%")
     else:
-        print(f"\nWasserflächen: Fehler")
+        _vprint(f"\nWasserflächen: Fehler")
+
+
+# Disk-Cache für komplette Square-Ergebnisse: ein erneuter Lauf für
+# dasselbe Square/Datum wird zu einem lokalen sqlite-Read statt fünf
+# Earth-Engine-Abfragen. Pfad per RISK_CACHE_PATH übersteuerbar; Einträge
+# verfallen nach RISK_CACHE_TTL Sekunden (Default 7 Tage, wie im Backend)
+# und die Tabelle ist auf RISK_CACHE_MAX_ROWS Zeilen begrenzt — beim
+# Einfügen fliegen abgelaufene und danach die ältesten Zeilen raus, damit
+# ein Portfolio-Lauf die Datei nicht unbegrenzt wachsen lässt.
+_DISK_CACHE_PATH = os.environ.get(
+    "RISK_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".ee_square_cache.sqlite3"),
+)
+_DISK_CACHE_TTL = int(os.environ.get("RISK_CACHE_TTL", 7 * 86400))
+_DISK_CACHE_MAX_ROWS = int(os.environ.get("RISK_CACHE_MAX_ROWS", 50_000))
+_disk_cache_conn = None
+
+
+def _disk_cache():
+    global _disk_cache_conn
+    if _disk_cache_conn is None:
+        conn = sqlite3.connect(_DISK_CACHE_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS square_cache ("
+            " key TEXT PRIMARY KEY, created REAL, payload TEXT)"
+        )
+        conn.commit()
+        _disk_cache_conn = conn
+    return _disk_cache_conn
 
 
-def extract_all_risk_data(square, date=TEST_DATE, fire_history_start=FIRE_HISTORY_START_DATE):
+def _disk_cache_key(square, date, fire_history_start):
+    raw = f"{square.serialize()},{date},{fire_history_start}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _disk_cache_get(key):
+    try:
+        row = _disk_cache().execute(
+            "SELECT payload FROM square_cache WHERE key = ? AND created > ?",
+            (key, time.time() - _DISK_CACHE_TTL),
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    try:
+        return json.loads(row[0])
+    except (ValueError, TypeError):
+        return None
+
+
+def _disk_cache_put(key, all_data):
+    try:
+        conn = _disk_cache()
+        conn.execute(
+            "DELETE FROM square_cache WHERE created <= ?",
+            (time.time() - _DISK_CACHE_TTL,),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO square_cache (key, created, payload) VALUES (?, ?, ?)",
+            (key, time.time(), json.dumps(all_data, ensure_ascii=False)),
+        )
+        # Älteste Zeilen zuerst verdrängen, sobald das Limit erreicht ist
+        conn.execute(
+            "DELETE FROM square_cache WHERE key IN ("
+            " SELECT key FROM square_cache ORDER BY created ASC"
+            " LIMIT max(0, (SELECT COUNT(*) FROM square_cache) - ?))",
+            (_DISK_CACHE_MAX_ROWS,),
+        )
+        conn.commit()
+    except sqlite3.Error:
+        # Cache-Fehler dürfen die Extraktion nie scheitern lassen
+        pass
+
+
+def extract_all_risk_data(square, date=TEST_DATE, fire_history_start=FIRE_HISTORY_START_DATE,
+                          center_lonlat=None):
     """
     Sammelt alle Wildfire-Risiko-Daten für den Square.
     
@@ -937,10 +1267,19 @@ def extract_all_risk_data(square, date=TEST_DATE, fire_history_start=FIRE_HISTOR
         square: ee.Geometry - Der 10x10m Square
         date: str - Datum im Format "YYYY-MM-DD" (Default: TEST_DATE)
         fire_history_start: str - Startdatum für historische Brände (Default: FIRE_HISTORY_START_DATE)
+        center_lonlat: tuple oder None - (lon, lat) des Square-Mittelpunkts
+                       (wird an get_historical_fires durchgereicht)
     
     Returns:
         dict: Dictionary mit allen extrahierten Daten
     """
+    # Disk-Cache zuerst: bei einem Treffer entfällt jede EE-Abfrage
+    cache_key = _disk_cache_key(square, date, fire_history_start)
+    cached = _disk_cache_get(cache_key)
+    if cached is not None:
+        _vprint(f"\nDaten für {date} aus dem Disk-Cache geladen")
+        return cached
+    
     total_start_time = time.time()
     all_data = {
         "square_info": {
@@ -954,77 +1293,106 @@ def extract_all_risk_data(square, date=TEST_DATE, fire_history_start=FIRE_HISTOR
         "current_conditions": {}
     }
     
-    print(f"\nExtrahiere Daten für {date}...")
+    _vprint(f"\nExtrahiere Daten für {date} (5 Abfragen parallel)...")
     
     # WorldCover Daten (bestehend)
-    print("  [1/5] WorldCover Landcover-Daten...", end="", flush=True)
-    try:
-        start_time = time.time()
+    def _run_worldcover():
         worldcover = load_worldcover()
         features = extract_square_data(worldcover, square)
         stats = get_square_statistics(worldcover, square)
-        elapsed = time.time() - start_time
-        print(f" ✓ ({elapsed:.1f}s)")
-        print(f"      Response: {len(features.get('features', []))} Features, Stats: {list(stats.keys()) if stats else 'None'}")
-        all_data["worldcover"] = {
+        return {
             "features": features,
             "statistics": stats
         }
-    except Exception as e:
-        print(f" ✗ Fehler: {e}")
-        all_data["worldcover"] = {"error": str(e)}
-    
-    # Historische Brände
-    print("  [2/5] Historische Brände (FIRMS)...", end="", flush=True)
-    try:
-        fire_data = get_historical_fires(square, fire_history_start, date)
-        all_data["fire_history"] = fire_data
-    except Exception as e:
-        print(f" ✗ Fehler: {e}")
-        all_data["fire_history"] = {"error": str(e)}
-    
-    # Aktuelle Bedingungen
-    current_conditions = {}
-    
-    # GLDAS-Daten (alle auf einmal für bessere Performance)
-    print("  [3/5] GLDAS-Daten (Temperatur, Bodenfeuchte, Wind)...", end="", flush=True)
-    try:
-        gldas_data = get_all_gldas_data(square, date)
-        current_conditions["surface_temperature"] = gldas_data["surface_temperature"]
-        current_conditions["soil_moisture"] = gldas_data["soil_moisture"]
-        current_conditions["soil_temperature"] = gldas_data["soil_temperature"]
-        current_conditions["wind_speed"] = gldas_data["wind_speed"]
-    except Exception as e:
-        print(f" ✗ Fehler: {e}")
-        current_conditions["surface_temperature"] = {"error": str(e)}
-        current_conditions["soil_moisture"] = {"error": str(e)}
-        current_conditions["soil_temperature"] = {"error": str(e)}
-        current_conditions["wind_speed"] = {"error": str(e)}
-    
-    # Vegetationsindizes
-    print("  [4/5] MODIS Vegetationsindizes...", end="", flush=True)
-    try:
-        vegetation = get_vegetation_indices(square, date)
-        current_conditions["vegetation"] = vegetation
-    except Exception as e:
-        print(f" ✗ Fehler: {e}")
-        current_conditions["vegetation"] = {"error": str(e)}
     
-    # Wasserflächen
-    print("  [5/5] Wasserflächen (GLCF)...", end="", flush=True)
-    try:
-        water = get_water_bodies(square)
-        current_conditions["water_coverage"] = water["water_coverage_percent"]
-        current_conditions["nearby_water_coverage"] = water["nearby_water_coverage_percent"]
-    except Exception as e:
-        print(f" ✗ Fehler: {e}")
-        current_conditions["water_coverage"] = None
-        current_conditions["nearby_water_coverage"] = None
+    # Die fünf Abfragen sind unabhängige, I/O-gebundene getInfo()-Aufrufe
+    # gegen Earth Engine. Parallel ausgeführt dauert die Extraktion ungefähr
+    # so lange wie die langsamste Einzelabfrage statt der Summe aller fünf.
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = {
+            "worldcover": executor.submit(_run_worldcover),
+            "fire_history": executor.submit(get_historical_fires, square, fire_history_start, date,
+                                            center_lonlat=center_lonlat),
+            "gldas": executor.submit(get_all_gldas_data, square, date),
+            "vegetation": executor.submit(get_vegetation_indices, square, date),
+            "water": executor.submit(get_water_bodies, square),
+        }
+        
+        _vprint("  [1/5] WorldCover Landcover-Daten...", end="", flush=True)
+        try:
+            start_time = time.time()
+            all_data["worldcover"] = futures["worldcover"].result()
+            elapsed = time.time() - start_time
+            _vprint(f" ✓ ({elapsed:.1f}s)")
+            features = all_data["worldcover"]["features"]
+            stats = all_data["worldcover"]["statistics"]
+            _vprint(f"      Response: {len(features.get('features', []))} Features, Stats: {list(stats.keys()) if stats else 'None'}")
+        except Exception as e:
+            _vprint(f" ✗ Fehler: {e}")
+            all_data["worldcover"] = {"error": str(e)}
+        
+        # Historische Brände
+        _vprint("  [2/5] Historische Brände (FIRMS)...", end="", flush=True)
+        try:
+            all_data["fire_history"] = futures["fire_history"].result()
+        except Exception as e:
+            _vprint(f" ✗ Fehler: {e}")
+            all_data["fire_history"] = {"error": str(e)}
+        
+        # Aktuelle Bedingungen
+        current_conditions = {}
+        
+        # GLDAS-Daten (alle auf einmal für bessere Performance)
+        _vprint("  [3/5] GLDAS-Daten (Temperatur, Bodenfeuchte, Wind)...", end="", flush=True)
+        try:
+            gldas_data = futures["gldas"].result()
+            current_conditions["surface_temperature"] = gldas_data["surface_temperature"]
+            current_conditions["soil_moisture"] = gldas_data["soil_moisture"]
+            current_conditions["soil_temperature"] = gldas_data["soil_temperature"]
+            current_conditions["wind_speed"] = gldas_data["wind_speed"]
+        except Exception as e:
+            _vprint(f" ✗ Fehler: {e}")
+            current_conditions["surface_temperature"] = {"error": str(e)}
+            current_conditions["soil_moisture"] = {"error": str(e)}
+            current_conditions["soil_temperature"] = {"error": str(e)}
+            current_conditions["wind_speed"] = {"error": str(e)}
+        
+        # Vegetationsindizes
+        _vprint("  [4/5] MODIS Vegetationsindizes...", end="", flush=True)
+        try:
+            current_conditions["vegetation"] = futures["vegetation"].result()
+        except Exception as e:
+            _vprint(f" ✗ Fehler: {e}")
+            current_conditions["vegetation"] = {"error": str(e)}
+        
+        # Wasserflächen
+        _vprint("  [5/5] Wasserflächen (GLCF)...", end="", flush=True)
+        try:
+            water = futures["water"].result()
+            current_conditions["water_coverage"] = water["water_coverage_percent"]
+            current_conditions["nearby_water_coverage"] = water["nearby_water_coverage_percent"]
+        except Exception as e:
+            _vprint(f" ✗ Fehler: {e}")
+            current_conditions["water_coverage"] = None
+            current_conditions["nearby_water_coverage"] = None
     
     all_data["current_conditions"] = current_conditions
     
     total_elapsed = time.time() - total_start_time
-    print(f"\n✓ Alle Daten extrahiert in {total_elapsed:.1f}s")
+    _vprint(f"\n✓ Alle Daten extrahiert in {total_elapsed:.1f}s")
+    
+    # Nur Läufe ohne Fehler in WorldCover, FIRMS, Vegetation und Wasser
+    # cachen — Teilausfälle sollen beim nächsten Lauf erneut versucht
+    # werden. GLDAS bleibt bewusst ausgenommen: dessen Fehler nach dem
+    # V20-Epochenende 2014 sind dauerhaft, nicht transient.
+    vegetation = current_conditions.get("vegetation") or {}
+    vegetation_ok = ("error" not in vegetation
+                     and "error" not in (vegetation.get("NDVI") or {}))
+    water_ok = current_conditions.get("water_coverage") is not None
+    if (vegetation_ok and water_ok
+            and "error" not in all_data["worldcover"]
+            and "error" not in all_data["fire_history"]):
+        _disk_cache_put(cache_key, all_data)
     
     return all_data
 
@@ -1037,22 +1405,40 @@ def save_data_to_json(all_data, output_file="square_data.json"):
         all_data: Dictionary mit allen extrahierten Daten
         output_file: Pfad zur Ausgabedatei
     """
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(all_data, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        # orjson serialisiert direkt nach UTF-8-Bytes, ohne Umweg über
+        # Python-Strings — bei Batch-Läufen mit vielen Ergebnisdateien
+        # um ein Vielfaches schneller als json.dump
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(all_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(all_data, f, indent=2, ensure_ascii=False)
     
-    print(f"\n✓ Daten gespeichert in: {output_file}")
+    _vprint(f"\n✓ Daten gespeichert in: {output_file}")
 
 
-def initialize_earth_engine():
+# High-Volume-Endpoint von Earth Engine: ausgelegt auf viele parallele
+# getInfo()-Abfragen, während der Standard-Endpoint ab ca. 10 gleichzeitigen
+# Requests drosselt. Für Batch-Extraktion vieler Squares unverzichtbar.
+EE_HIGH_VOLUME_URL = "https://earthengine-highvolume.googleapis.com"
+
+
+def initialize_earth_engine(high_volume=True):
     """
     Initialisiert Earth Engine (versucht verschiedene Methoden).
     
+    Args:
+        high_volume: Wenn True, wird der High-Volume-Endpoint verwendet
+                     (empfohlen für parallele Abfragen, siehe extract_many)
+    
     Returns:
         bool: True bei Erfolg, False bei Fehler
     """
+    opt_url = EE_HIGH_VOLUME_URL if high_volume else None
     try:
         # Versuche zu initialisieren (funktioniert wenn bereits authentifiziert)
-        ee.Initialize()
+        ee.Initialize(opt_url=opt_url)
         return True
     except Exception:
         # Versuche mit Service Account
@@ -1067,16 +1453,61 @@ def initialize_earth_engine():
                 
                 credentials = ee.ServiceAccountCredentials(None, credentials_path)
                 if project_id:
-                    ee.Initialize(credentials, project=project_id)
+                    ee.Initialize(credentials, project=project_id, opt_url=opt_url)
                 else:
-                    ee.Initialize(credentials)
+                    ee.Initialize(credentials, opt_url=opt_url)
                 return True
             except Exception as e:
-                print(f"Fehler bei Service Account Initialisierung: {e}")
+                _vprint(f"Fehler bei Service Account Initialisierung: {e}")
                 return False
         return False
 
 
+def _extract_one(center_lon, center_lat, date, fire_history_start):
+    """
+    Extrahiert die Risiko-Daten für ein Square um die gegebene Koordinate.
+    
+    Baut das 10x10m Square analog zu get_test_square, aber für beliebige
+    Koordinaten — wird von den Pool-Workern in extract_many aufgerufen.
+    """
+    import math
+    half_size_deg_lat = (SQUARE_SIZE_METERS / 2) / 111320
+    half_size_deg_lon = (SQUARE_SIZE_METERS / 2) / (111320 * math.cos(math.radians(center_lat)))
+    square = ee.Geometry.Rectangle([
+        center_lon - half_size_deg_lon,
+        center_lat - half_size_deg_lat,
+        center_lon + half_size_deg_lon,
+        center_lat + half_size_deg_lat
+    ])
+    return extract_all_risk_data(square, date, fire_history_start,
+                                 center_lonlat=(center_lon, center_lat))
+
+
+def extract_many(coordinates, date=TEST_DATE, fire_history_start=FIRE_HISTORY_START_DATE, processes=25):
+    """
+    Extrahiert Risiko-Daten für viele Squares parallel.
+    
+    Nutzt einen multiprocessing.Pool gegen den High-Volume-Endpoint —
+    der Earth-Engine-Zustand überlebt kein fork(), daher initialisiert
+    jeder Worker über den Pool-Initializer neu.
+    
+    Args:
+        coordinates: Liste von (lon, lat) Tupeln (Square-Mittelpunkte)
+        date: Datum für aktuelle Bedingungen
+        fire_history_start: Startdatum der Brand-Historie
+        processes: Anzahl paralleler Worker (Default 25, passend zum Endpoint)
+    
+    Returns:
+        list: Ergebnisse von extract_all_risk_data in Eingabe-Reihenfolge
+    """
+    from multiprocessing import Pool
+    
+    args = [(lon, lat, date, fire_history_start) for lon, lat in coordinates]
+    with Pool(processes=min(processes, max(1, len(args))),
+              initializer=initialize_earth_engine) as pool:
+        return pool.starmap(_extract_one, args)
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Wildfire Risk Score Datenabfrage - 10x10m Square")